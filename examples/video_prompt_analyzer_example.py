@@ -0,0 +1,53 @@
+"""
+Example: Video Prompt Analyzer
+
+Demonstrates model catalog lookups, temporal-critical parameters, prompt
+quality analysis and multi-scene consistency planning.
+
+Run from the repository root:
+    python -m examples.video_prompt_analyzer_example
+"""
+
+from src.analyzers.video_prompt_analyzer import (
+    VideoPromptAnalyzer,
+    ModelType,
+    create_example_scene,
+)
+
+
+def main():
+    # Example usage
+    analyzer = VideoPromptAnalyzer()
+
+    # Analyze Kling model
+    kling_info = analyzer.get_model_info(ModelType.KLING)
+    print(f"Kling Model Info:")
+    print(f"  Max Duration: {kling_info['max_duration']}")
+    print(f"  Resolution: {kling_info['max_resolution']}")
+    print(f"  Modes: {kling_info['supported_modes']}")
+
+    # Get temporal critical parameters
+    critical_params = analyzer.get_temporal_critical_params(ModelType.KLING)
+    print(f"\nTemporal Critical Parameters: {critical_params}")
+
+    # Create and analyze example scene
+    scene = create_example_scene(ModelType.KLING)
+    prompt = scene.to_prompt(ModelType.KLING)
+    print(f"\nGenerated Prompt:\n{prompt}")
+
+    # Analyze prompt quality
+    quality = analyzer.analyze_prompt_quality(prompt, ModelType.KLING)
+    print(f"\nPrompt Quality Score: {quality['score']:.1f}%")
+    print(f"Suggestions: {quality['suggestions']}")
+
+    # Multi-scene planning
+    scenes = [create_example_scene(ModelType.KLING) for _ in range(3)]
+    plan = analyzer.generate_multi_scene_plan(scenes, ModelType.KLING)
+    print(f"\nMulti-Scene Consistency Report:")
+    print(f"  Total Scenes: {plan['total_scenes']}")
+    print(f"  Character Consistency: {plan['consistency_checks']['character_consistency']}")
+    print(f"  Style Uniformity: {plan['consistency_checks']['style_uniformity']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, NamedTuple
 from enum import Enum
 from datetime import datetime
 
@@ -191,9 +191,10 @@ class CacheKey:
         return f"{self.provider}:{self.model}:{hash(self.prompt)}:{self.parameters_hash}"
 
 
-@dataclass
-class VersionMigration:
+class VersionMigration(NamedTuple):
+    # NamedTuple rather than a dataclass: no per-instance __dict__ while
+    # keeping a default field on Python < 3.10 (no dataclass slots=True)
     from_version: SchemaVersion
     to_version: SchemaVersion
-    migration_fn: callable
+    migration_fn: Callable
     backward_compatible: bool = True
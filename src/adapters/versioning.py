@@ -49,7 +49,14 @@ class VersionManager:
         self,
         request_data: Dict[str, Any],
         target_version: SchemaVersion,
+        copy: bool = True,
     ) -> Dict[str, Any]:
+        """Migrate ``request_data`` to ``target_version``.
+
+        Migration functions mutate their argument in place, so the input is
+        shallow-copied once up front. Internal callers that already own the
+        dict can pass ``copy=False`` to skip that copy.
+        """
         current_version = SchemaVersion(request_data.get("schema_version", "1.0"))
 
         if current_version == target_version:
@@ -63,7 +70,7 @@ class VersionManager:
                 f"to {target_version.value}"
             )
 
-        migrated_data = request_data.copy()
+        migrated_data = request_data.copy() if copy else request_data
 
         for from_ver, to_ver in migration_path:
             migration = self.migrations[(from_ver, to_ver)]
@@ -77,8 +84,9 @@ class VersionManager:
         self,
         response_data: Dict[str, Any],
         target_version: SchemaVersion,
+        copy: bool = True,
     ) -> Dict[str, Any]:
-        return self.migrate_request(response_data, target_version)
+        return self.migrate_request(response_data, target_version, copy=copy)
 
     def _find_migration_path(
         self,
@@ -107,8 +115,11 @@ class VersionManager:
 
         return path
 
+    # Migration functions mutate ``data`` in place and return it; the single
+    # defensive copy happens in ``migrate_request``.
+
     def _migrate_v1_0_to_v1_1(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        migrated = data.copy()
+        migrated = data
 
         if "metadata" not in migrated:
             migrated["metadata"] = {}
@@ -126,7 +137,7 @@ class VersionManager:
         return migrated
 
     def _migrate_v1_1_to_v2_0(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        migrated = data.copy()
+        migrated = data
 
         if "provider" in migrated and isinstance(migrated["provider"], str):
             migrated["provider_info"] = {
@@ -6,13 +6,24 @@ Analyzes video frames to detect motion patterns, optical flow, and movement char
 
 import cv2
 import numpy as np
+import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Part of the analysis cache key; bump whenever the motion analysis or its
+# output format changes so results from older code are not reused
+ANALYSIS_CACHE_VERSION = 2
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,6 +41,20 @@ class MotionDetector:
     - Motion intensity measurement
     """
     
+    __slots__ = (
+        "config",
+        "motion_history",
+        "background_subtractor",
+        "_flow_input_shape",
+        "_flow_small_shape",
+        "_flow_scale",
+        "_flow_buf",
+        "_gray_buf",
+        "_prev_gray_buf",
+        "_mask_batch",
+        "_executor",
+    )
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize motion detector with configuration.
@@ -39,10 +64,18 @@ class MotionDetector:
         """
         self.config = self._load_config(config_path)
         self.motion_history = []
+        self._flow_input_shape = None
+        self._flow_small_shape = None
+        self._flow_scale = 1.0
+        self._flow_buf = None
+        self._gray_buf = None
+        self._prev_gray_buf = None
+        self._mask_batch = None
+        self._executor = None
         self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
             history=self.config.get('background_history', 500),
             varThreshold=self.config.get('var_threshold', 16),
-            detectShadows=True
+            detectShadows=self.config.get('detect_shadows', False)
         )
         
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
@@ -52,15 +85,31 @@ class MotionDetector:
             "min_contour_area": 100,
             "background_history": 500,
             "var_threshold": 16,
+            # Shadow classification roughly doubles MOG2 per-pixel work and is
+            # only needed to tell shadows (127) apart from motion (255).
+            # Disabled, the mask is strictly binary {0, 255}.
+            "detect_shadows": False,
             "optical_flow_params": {
                 "winSize": (15, 15),
                 "maxLevel": 2,
                 "criteria": (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
             },
+            # Optional long side to downsample frames to before optical flow
+            # (0 keeps full resolution). Downsampling biases the mean flow
+            # magnitude low even after rescaling to full-resolution pixels
+            # (about 36% lower at 320 on a 640x360 clip) as fine motion is
+            # averaged away; the motion thresholds assume full resolution.
+            "flow_max_side": 0,
             "frame_skip": 1,
+            # Frames whose motion masks are labeled together per thread-pool batch
+            "event_batch_size": 16,
             "output_format": "json",
             "save_frames": False,
-            "cache_results": True
+            # Opt-in reuse of analysis for unchanged videos (keyed on cache
+            # version, path, size, mtime and config); cache_dir defaults to
+            # ~/.cache/animatize/motion
+            "cache_results": False,
+            "cache_dir": None
         }
         
         if config_path and os.path.exists(config_path):
@@ -86,6 +135,13 @@ class MotionDetector:
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
             
+        cache_path = None
+        if self.config.get('cache_results', False):
+            cache_path = self._cache_path(video_path)
+            cached = self._load_cached_analysis(cache_path)
+            if cached is not None:
+                return cached
+            
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             raise ValueError(f"Cannot open video file: {video_path}")
@@ -109,79 +165,204 @@ class MotionDetector:
             prev_frame = None
             frame_count = 0
             
+            # Motion masks are buffered and their blob labeling runs in batches
+            # on worker threads (OpenCV releases the GIL) to amortize per-frame
+            # Python overhead; MOG2 itself stays sequential since it is stateful
+            batch_size = max(1, int(self.config.get('event_batch_size', 16)))
+            pending = []
+            frame_skip = max(1, int(self.config.get('frame_skip', 1)))
+            
+            executor = self._get_executor()
             while True:
                 ret, frame = cap.read()
                 if not ret:
                     break
                     
-                if frame_count % self.config.get('frame_skip', 1) == 0:
-                    # Convert to grayscale
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    
-                    # Motion detection
-                    motion_mask = self.background_subtractor.apply(gray)
-                    motion_events = self._detect_motion_events(motion_mask)
-                    
-                    # Optical flow
-                    if prev_frame is not None:
-                        flow_data = self._calculate_optical_flow(prev_frame, gray)
-                        motion_data["optical_flow_data"].append(flow_data)
-                    
-                    # Motion intensity
-                    intensity = self._calculate_motion_intensity(motion_mask)
-                    motion_data["motion_intensity"].append({
-                        "frame": frame_count,
-                        "intensity": intensity,
-                        "events": len(motion_events)
-                    })
-                    
-                    # Store motion events
-                    if motion_events:
-                        motion_data["motion_events"].extend([
-                            {"frame": frame_count, **event} 
-                            for event in motion_events
-                        ])
-                    
-                    prev_frame = gray
-                    
+                # Reallocate reusable buffers when the frame geometry changes
+                batch_shape = (batch_size,) + frame.shape[:2]
+                if self._mask_batch is None or self._mask_batch.shape != batch_shape:
+                    self._flush_motion_batch(pending, motion_data, executor)
+                    self._mask_batch = np.empty(batch_shape, dtype=np.uint8)
+                    self._gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+                    self._prev_gray_buf = np.empty_like(self._gray_buf)
+                    prev_frame = None
+                
+                # Convert to grayscale into a reused, double-buffered array
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+                
+                # Motion detection into the next free batch slot
+                motion_mask = self.background_subtractor.apply(
+                    gray, fgmask=self._mask_batch[len(pending)]
+                )
+                pending.append((frame_count, motion_mask))
+                
+                # Optical flow
+                if prev_frame is not None:
+                    flow_data = self._calculate_optical_flow(prev_frame, gray)
+                    motion_data["optical_flow_data"].append(flow_data)
+                
+                if len(pending) == batch_size:
+                    self._flush_motion_batch(pending, motion_data, executor)
+                
+                prev_frame = gray
+                self._gray_buf, self._prev_gray_buf = self._prev_gray_buf, self._gray_buf
+                
                 frame_count += 1
                 
+                # Skip unprocessed frames with grab(), which advances the
+                # stream without retrieving/converting the pixel data
+                for _ in range(frame_skip - 1):
+                    if not cap.grab():
+                        break
+                    frame_count += 1
+            
+            self._flush_motion_batch(pending, motion_data, executor)
+            
             # Generate summary
             motion_data["summary"] = self._generate_summary(motion_data)
             
+            if cache_path is not None:
+                self._store_cached_analysis(cache_path, motion_data)
+            
             return motion_data
             
         finally:
             cap.release()
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the detector's mask-labeling pool, starting it on first use."""
+        if self._executor is None:
+            batch_size = max(1, int(self.config.get('event_batch_size', 16)))
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(batch_size, os.cpu_count() or 1),
+                thread_name_prefix="motion-mask",
+            )
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the mask-labeling thread pool (restarted on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self) -> "MotionDetector":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _cache_path(self, video_path: str) -> Path:
+        """Build the on-disk cache location for a video and the current config."""
+        stat = os.stat(video_path)
+        key = hashlib.blake2b(digest_size=20)
+        key.update(f"v{ANALYSIS_CACHE_VERSION}:".encode())
+        key.update(os.path.abspath(video_path).encode())
+        key.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        key.update(json.dumps(self.config, sort_keys=True, default=str).encode())
+        
+        cache_dir = self.config.get('cache_dir')
+        if cache_dir:
+            cache_dir = Path(cache_dir)
+        else:
+            cache_dir = Path.home() / ".cache" / "animatize" / "motion"
+        return cache_dir / f"{key.hexdigest()}.json"
+    
+    def _load_cached_analysis(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Return a previously stored analysis, or None on a miss."""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception as e:
+            logger.warning(f"Failed to read motion cache {cache_path}: {e}")
+            return None
+    
+    def _store_cached_analysis(self, cache_path: Path, motion_data: Dict[str, Any]) -> None:
+        """Persist an analysis result; failures only cost a future cache miss."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            if orjson is not None:
+                payload = orjson.dumps(motion_data, default=str,
+                                       option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(motion_data, default=str).encode()
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write motion cache {cache_path}: {e}")
+    
+    def _flush_motion_batch(self, pending: List[Tuple[int, np.ndarray]],
+                            motion_data: Dict[str, Any],
+                            executor: ThreadPoolExecutor) -> None:
+        """Analyze buffered motion masks and record results in frame order."""
+        if not pending:
+            return
+        
+        masks = [mask for _, mask in pending]
+        for (frame_index, _), (motion_events, intensity) in zip(
+            pending, executor.map(self._analyze_motion_mask, masks)
+        ):
+            # Motion intensity
+            motion_data["motion_intensity"].append({
+                "frame": frame_index,
+                "intensity": intensity,
+                "events": len(motion_events)
+            })
+            
+            # Store motion events
+            if motion_events:
+                motion_data["motion_events"].extend([
+                    {"frame": frame_index, **event}
+                    for event in motion_events
+                ])
+        
+        pending.clear()
+    
+    def _analyze_motion_mask(self, motion_mask: np.ndarray) -> Tuple[List[Dict[str, Any]], float]:
+        """Extract motion events and intensity from a single motion mask."""
+        return (self._detect_motion_events(motion_mask),
+                self._calculate_motion_intensity(motion_mask))
+    
     def _detect_motion_events(self, motion_mask: np.ndarray) -> List[Dict[str, Any]]:
         """Detect motion events from motion mask."""
-        events = []
-        
-        # Find contours
-        contours, _ = cv2.findContours(
-            motion_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        # Label blobs and collect bbox/area in a single pass (label 0 is background)
+        _, _, stats, _ = cv2.connectedComponentsWithStatsWithAlgorithm(
+            motion_mask, 8, cv2.CV_32S, cv2.CCL_BOLELLI
         )
+        stats = stats[1:]
+        stats = stats[stats[:, cv2.CC_STAT_AREA] > self.config.get('min_contour_area', 100)]
         
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > self.config.get('min_contour_area', 100):
-                x, y, w, h = cv2.boundingRect(contour)
-                events.append({
-                    "bbox": [int(x), int(y), int(w), int(h)],
-                    "area": int(area),
-                    "center": [int(x + w//2), int(y + h//2)]
-                })
+        bboxes = stats[:, :4]
+        centers = bboxes[:, :2] + bboxes[:, 2:] // 2
         
-        return events
+        return [
+            {"bbox": bbox, "area": area, "center": center}
+            for bbox, area, center in zip(
+                bboxes.tolist(), stats[:, cv2.CC_STAT_AREA].tolist(), centers.tolist()
+            )
+        ]
     
     def _calculate_optical_flow(self, prev_frame: np.ndarray, 
                                curr_frame: np.ndarray) -> Dict[str, Any]:
         """Calculate optical flow between frames using Farneback method."""
         try:
-            # Calculate dense optical flow using Farneback
+            if curr_frame.shape != self._flow_input_shape:
+                self._update_flow_geometry(curr_frame.shape)
+            
+            if self._flow_small_shape is not None:
+                prev_frame = cv2.resize(prev_frame, self._flow_small_shape,
+                                        interpolation=cv2.INTER_AREA)
+                curr_frame = cv2.resize(curr_frame, self._flow_small_shape,
+                                        interpolation=cv2.INTER_AREA)
+            
+            # Calculate dense optical flow using Farneback, writing into the
+            # reused output buffer (flags=0: its previous contents are ignored)
             flow = cv2.calcOpticalFlowFarneback(
-                prev_frame, curr_frame, None,
+                prev_frame, curr_frame, self._flow_buf,
                 pyr_scale=0.5,
                 levels=3,
                 winsize=15,
@@ -194,49 +375,85 @@ class MotionDetector:
             if flow is None:
                 return {"magnitude": 0.0, "direction": 0.0, "mean_flow": [0.0, 0.0]}
                 
-            # Calculate flow statistics
+            # Calculate flow statistics, rescaled to full-resolution pixels
             magnitude, angle = cv2.cartToPolar(flow[..., 0], flow[..., 1])
+            inv_scale = 1.0 / self._flow_scale
             
             return {
-                "magnitude": float(np.mean(magnitude)),
+                "magnitude": float(np.mean(magnitude)) * inv_scale,
                 "direction": float(np.mean(angle)),
-                "mean_flow": [float(np.mean(flow[..., 0])), float(np.mean(flow[..., 1]))]
+                "mean_flow": [float(np.mean(flow[..., 0])) * inv_scale,
+                              float(np.mean(flow[..., 1])) * inv_scale]
             }
             
         except Exception as e:
             logger.warning(f"Optical flow calculation failed: {e}")
             return {"magnitude": 0.0, "direction": 0.0, "mean_flow": [0.0, 0.0]}
     
+    def _update_flow_geometry(self, frame_shape: Tuple[int, ...]) -> None:
+        """Derive the downsampled optical-flow size for a given frame shape."""
+        height, width = frame_shape[:2]
+        max_side = self.config.get('flow_max_side', 0)
+        
+        self._flow_input_shape = frame_shape
+        if max_side and max(height, width) > max_side:
+            self._flow_scale = max_side / max(height, width)
+            self._flow_small_shape = (max(1, round(width * self._flow_scale)),
+                                      max(1, round(height * self._flow_scale)))
+        else:
+            self._flow_scale = 1.0
+            self._flow_small_shape = None
+        
+        flow_width, flow_height = self._flow_small_shape or (width, height)
+        self._flow_buf = np.zeros((flow_height, flow_width, 2), dtype=np.float32)
+    
     def _calculate_motion_intensity(self, motion_mask: np.ndarray) -> float:
         """Calculate overall motion intensity from motion mask."""
-        return float(np.sum(motion_mask > self.config.get('motion_threshold', 25)) / 
-                    motion_mask.size)
+        if not self.config.get('detect_shadows', False):
+            # Binary {0, 255} mask: every non-zero pixel is motion
+            return cv2.countNonZero(motion_mask) / motion_mask.size
+        
+        # Threshold and popcount on the uint8 mask without a boolean temporary
+        _, above = cv2.threshold(
+            motion_mask, self.config.get('motion_threshold', 25), 255, cv2.THRESH_BINARY
+        )
+        return cv2.countNonZero(above) / motion_mask.size
     
     def _generate_summary(self, motion_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate summary statistics from motion data."""
         intensities = [item["intensity"] for item in motion_data["motion_intensity"]]
         events = motion_data["motion_events"]
+        centers = self._event_centers(events)
         
         summary = {
             "total_motion_events": len(events),
             "average_intensity": np.mean(intensities) if intensities else 0,
             "max_intensity": np.max(intensities) if intensities else 0,
             "motion_density": len(events) / len(motion_data["motion_intensity"]) if motion_data["motion_intensity"] else 0,
-            "dominant_motion_regions": self._find_dominant_regions(events),
-            "motion_patterns": self._classify_motion_patterns(events)
+            "dominant_motion_regions": self._find_dominant_regions(events, centers),
+            "motion_patterns": self._classify_motion_patterns(events, centers)
         }
         
         return summary
     
-    def _find_dominant_regions(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _event_centers(events: List[Dict[str, Any]]) -> np.ndarray:
+        """Stack event centers into an (N, 2) int32 array."""
+        if not events:
+            return np.empty((0, 2), dtype=np.int32)
+        return np.array([e["center"] for e in events], dtype=np.int32)
+    
+    def _find_dominant_regions(self, events: List[Dict[str, Any]],
+                               centers: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """Find dominant motion regions from events."""
         if not events:
             return []
+        if centers is None:
+            centers = self._event_centers(events)
             
         # Simple clustering of events by proximity
         regions = []
-        for event in events:
-            x, y = event["center"]
+        for x, y in centers.tolist():
             found = False
             
             for region in regions:
@@ -251,10 +468,13 @@ class MotionDetector:
         # Sort by frequency
         return sorted(regions, key=lambda r: r["count"], reverse=True)[:3]
     
-    def _classify_motion_patterns(self, events: List[Dict[str, Any]]) -> List[str]:
+    def _classify_motion_patterns(self, events: List[Dict[str, Any]],
+                                  centers: Optional[np.ndarray] = None) -> List[str]:
         """Classify motion patterns based on event distribution."""
         if len(events) < 10:
             return ["minimal"]
+        if centers is None:
+            centers = self._event_centers(events)
             
         # Simple pattern classification
         patterns = []
@@ -267,12 +487,8 @@ class MotionDetector:
             patterns.append("low_frequency")
             
         # Check for spatial distribution
-        if events:
-            x_coords = [e["center"][0] for e in events]
-            y_coords = [e["center"][1] for e in events]
-            
-            x_range = max(x_coords) - min(x_coords)
-            y_range = max(y_coords) - min(y_coords)
+        if len(centers):
+            x_range, y_range = np.ptp(centers, axis=0)
             
             if x_range > 200 or y_range > 200:
                 patterns.append("distributed")
@@ -294,8 +510,17 @@ class MotionDetector:
         """
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(analysis_data, f, indent=2, default=str)
+        if orjson is not None:
+            # orjson serializes NumPy scalars/arrays natively in C
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    analysis_data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(analysis_data, f, indent=2, default=str)
             
         logger.info(f"Motion analysis saved to: {output_path}")
         return output_path
@@ -347,4 +572,6 @@ if __name__ == "__main__":
         
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        detector.close()
\ No newline at end of file
@@ -3,14 +3,206 @@ ANiMAtiZE Movement Prediction Module
 Analyzes static images to generate justified cinematic movement prompts
 """
 
+from __future__ import annotations
+
+import errno
 import json
-import cv2
-import numpy as np
-from PIL import Image
-from typing import Dict, List, Tuple, Optional
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, NamedTuple, Tuple, Optional, TYPE_CHECKING
 import logging
 from pathlib import Path
 
+# OpenCV and NumPy are imported on first image analysis (see _load_cv) so
+# rule loading, validation and saving do not pay their import cost
+if TYPE_CHECKING:
+    import cv2
+    import numpy as np
+else:
+    cv2 = None
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pixel stride used when sampling scene-wide environmental statistics
+ENV_SAMPLE_STRIDE = 4
+
+# Images whose long side (read from the file header) exceeds this many
+# pixels are decoded at half resolution
+REDUCED_DECODE_MIN_SIDE = 1920
+
+# Byte budget for decoded image planes kept for re-analysis of unchanged
+# files (a 4K image holds roughly 70 MB of planes); see set_prep_cache_limit
+PREP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Edge maps sparser than this fraction of pixels skip Hough line detection
+MIN_HOUGH_EDGE_DENSITY = 0.01
+
+# Keywords that mark a movement justification as physically/compositionally grounded
+JUSTIFICATION_KEYWORDS = ('gravity', 'natural', 'composition')
+
+
+def _load_cv() -> None:
+    """Bind the module-level ``cv2``/``np`` names on first use"""
+    global cv2, np
+    if cv2 is None:
+        import cv2 as _cv2
+        import numpy as _np
+        cv2, np = _cv2, _np
+
+
+class _PreparedImage(NamedTuple):
+    """Decoded image plus the derived planes shared by the analyzers"""
+    bgr: np.ndarray
+    gray: np.ndarray
+    hsv: np.ndarray
+    edges: np.ndarray
+    small_gray: np.ndarray
+    small_edges: np.ndarray
+    decode_factor: int
+    full_size: Tuple[int, int]
+
+
+def _header_size(image_path: str) -> Optional[Tuple[int, int]]:
+    """Read ``(width, height)`` from the image header without decoding pixels"""
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            return img.size
+    except Exception:
+        return None
+
+
+def _load_and_prep(image_path: str, mtime_ns: int, size: int) -> _PreparedImage:
+    """
+    Decode an image and derive its gray/HSV/edge planes
+    
+    ``mtime_ns`` and ``size`` identify the file version for the prep cache.
+    The arrays are shared between callers and marked read-only.
+    """
+    _load_cv()
+    
+    # Large images go through the codec's reduced-size decode path;
+    # analysis thresholds are rescaled to full-resolution units.
+    header_size = _header_size(image_path)
+    decode_factor = 2 if header_size and max(header_size) > REDUCED_DECODE_MIN_SIDE else 1
+    bgr = cv2.imread(
+        image_path,
+        cv2.IMREAD_REDUCED_COLOR_2 if decode_factor == 2 else cv2.IMREAD_COLOR
+    )
+    if bgr is None:
+        raise ValueError(f"Cannot decode image: {image_path}")
+    height, width = bgr.shape[:2]
+    if decode_factor == 1:
+        full_size = (width, height)
+    else:
+        # Header dimensions precede EXIF rotation, which imread applies
+        full_width, full_height = header_size
+        if (width > height) != (full_width > full_height):
+            full_width, full_height = full_height, full_width
+        full_size = (full_width, full_height)
+    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+    edges = cv2.Canny(gray, 50, 150)
+    
+    # Dominant-line orientation survives half resolution, so camera
+    # analysis runs Canny/Hough on a quarter of the pixels
+    small_gray = cv2.resize(gray, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+    small_edges = cv2.Canny(small_gray, 50, 150)
+    
+    planes = (bgr, gray, hsv, edges, small_gray, small_edges)
+    for plane in planes:
+        plane.flags.writeable = False
+    return _PreparedImage(*planes, decode_factor, full_size)
+
+
+def _prepared_nbytes(prepared: _PreparedImage) -> int:
+    """Memory held by a prepared image's pixel planes"""
+    return sum(plane.nbytes for plane in prepared[:6])
+
+
+class _PrepCache:
+    """LRU of prepared images bounded by the bytes their planes hold"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, image_path: str, mtime_ns: int, size: int) -> _PreparedImage:
+        """Return the prepared image for this file version, building it on a miss"""
+        key = (image_path, mtime_ns, size)
+        with self._lock:
+            prepared = self._entries.get(key)
+            if prepared is not None:
+                self._entries.move_to_end(key)
+                return prepared
+        
+        prepared = _load_and_prep(image_path, mtime_ns, size)
+        nbytes = _prepared_nbytes(prepared)
+        with self._lock:
+            if nbytes <= self.max_bytes and key not in self._entries:
+                self._entries[key] = prepared
+                self._bytes += nbytes
+                self._evict()
+        return prepared
+    
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting least recently used entries"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _prepared_nbytes(evicted)
+
+
+_PREP_CACHE = _PrepCache(PREP_CACHE_MAX_BYTES)
+
+
+def set_prep_cache_limit(max_bytes: int) -> None:
+    """
+    Bound the memory used to keep decoded images for re-analysis
+    
+    Args:
+        max_bytes: Byte budget for cached image planes (0 disables caching)
+    """
+    _PREP_CACHE.resize(max(0, int(max_bytes)))
+
+
+@lru_cache(maxsize=8)
+def _load_rules_cached(config_path: str) -> Dict:
+    """Parse a rules file once per process; the result is shared read-only"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _analyze_image_in_worker(config_path: str, image_path: str) -> Dict:
+    """Process-pool entry point; rules are parsed once per worker process"""
+    return MovementPredictor(config_path).analyze_image(image_path)
+
+
 class MovementPredictor:
     """
     Predicts justified cinematic movements from static images
@@ -19,14 +211,13 @@ class MovementPredictor:
     
     def __init__(self, config_path: str = None):
         self.config_path = config_path or "configs/movement_prediction_rules.json"
-        self.rules = self._load_rules()
         self.logger = logging.getLogger(__name__)
+        self.rules = self._load_rules()
         
     def _load_rules(self) -> Dict:
         """Load movement prediction rules from JSON"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_rules_cached(os.path.abspath(self.config_path))
         except FileNotFoundError:
             self.logger.error(f"Rules file not found: {self.config_path}")
             return {}
@@ -42,16 +233,27 @@ class MovementPredictor:
             Dictionary with movement predictions and justifications
         """
         try:
-            image = Image.open(image_path)
-            cv_image = cv2.imread(image_path)
+            if not os.path.exists(image_path):
+                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), image_path)
+            
+            # Decoded/derived planes are memoized per file version (within
+            # the prep cache's byte budget) so re-analysis of an unchanged
+            # image skips decode and Canny
+            stat = os.stat(image_path)
+            prepared = _PREP_CACHE.get(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+            cv_image, gray, hsv, edges, small_gray, small_edges, decode_factor, full_size = prepared
             
             analysis = {
                 "image_path": image_path,
-                "image_size": image.size,
+                "image_size": list(full_size),
                 "movement_predictions": {
-                    "character_actions": self._analyze_character_movement(cv_image),
-                    "camera_movements": self._analyze_camera_movement(cv_image),
-                    "environment_animations": self._analyze_environmental_motion(cv_image)
+                    "character_actions": self._analyze_character_movement(cv_image, gray, edges),
+                    "camera_movements": self._analyze_camera_movement(
+                        cv_image, small_gray, small_edges, scale=0.5 / decode_factor
+                    ),
+                    "environment_animations": self._analyze_environmental_motion(
+                        cv_image, gray, hsv, pixel_scale=decode_factor ** 2
+                    )
                 },
                 "justifications": {},
                 "generated_prompts": []
@@ -66,22 +268,56 @@ class MovementPredictor:
             self.logger.error(f"Error analyzing image {image_path}: {str(e)}")
             return {"error": str(e)}
     
-    def _analyze_character_movement(self, image: np.ndarray) -> List[Dict]:
+    def analyze_images(self, image_paths: List[str],
+                       workers: Optional[int] = None) -> List[Dict]:
+        """
+        Analyze several images in parallel worker processes
+        
+        Args:
+            image_paths: Paths to the image files
+            workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            Analysis dictionaries in the same order as ``image_paths``
+        """
+        if not image_paths:
+            return []
+        
+        # Workers rebuild a predictor from the config path instead of
+        # receiving this instance (and its rules dict) pickled per task.
+        # Each image is analyzed once, so workers keep no decoded planes.
+        worker_fn = partial(_analyze_image_in_worker, self.config_path)
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=set_prep_cache_limit,
+                                 initargs=(0,)) as executor:
+            return list(executor.map(worker_fn, image_paths, chunksize=4))
+    
+    def _analyze_character_movement(self, image: np.ndarray,
+                                    gray: Optional[np.ndarray] = None,
+                                    edges: Optional[np.ndarray] = None) -> List[Dict]:
         """Analyze character pose and predict justified movements"""
+        _load_cv()
         predictions = []
         
         # Basic pose analysis using OpenCV
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Detect body contours and key points
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        if contours:
-            largest_contour = max(contours, key=cv2.contourArea)
+        if edges is None:
+            if gray is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            edges = cv2.Canny(gray, 50, 150)
+        
+        # Detect body outlines as connected edge blobs; stats carry every
+        # blob's bounding box from a single labeling pass (label 0 is background)
+        blob_count, _, stats, _ = cv2.connectedComponentsWithStats(edges, connectivity=8)
+        
+        if blob_count > 1:
+            # Rank blobs by bounding-box area, the closest stand-in for the
+            # region an outline encloses
+            widths = stats[1:, cv2.CC_STAT_WIDTH]
+            heights = stats[1:, cv2.CC_STAT_HEIGHT]
+            largest = int((widths * heights).argmax())
             
-            # Simple pose analysis based on contour shape
-            x, y, w, h = cv2.boundingRect(largest_contour)
+            # Simple pose analysis based on outline shape
+            w, h = int(widths[largest]), int(heights[largest])
             aspect_ratio = w / h
             
             # Determine pose type and predict movement
@@ -108,8 +344,17 @@ class MovementPredictor:
         
         return predictions
     
-    def _analyze_camera_movement(self, image: np.ndarray) -> List[Dict]:
-        """Analyze composition to determine justified camera movements"""
+    def _analyze_camera_movement(self, image: np.ndarray,
+                                 gray: Optional[np.ndarray] = None,
+                                 edges: Optional[np.ndarray] = None,
+                                 scale: float = 1.0) -> List[Dict]:
+        """
+        Analyze composition to determine justified camera movements
+        
+        ``gray``/``edges`` may be downsampled by ``scale`` relative to
+        ``image``; pixel thresholds are scaled to match.
+        """
+        _load_cv()
         predictions = []
         
         # Analyze composition elements
@@ -120,26 +365,33 @@ class MovementPredictor:
         third_x, third_y = width // 3, height // 3
         
         # Detect leading lines using edge detection
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, 50, minLineLength=50, maxLineGap=10)
+        if edges is None:
+            if gray is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            edges = cv2.Canny(gray, 50, 150)
+        # Near-empty edge maps cannot produce dominant lines; skip the full
+        # Hough accumulator vote for them
+        hough_threshold = max(1, int(50 * scale))
+        edge_count = cv2.countNonZero(edges)
+        if edge_count < hough_threshold or edge_count < MIN_HOUGH_EDGE_DENSITY * edges.size:
+            lines = None
+        else:
+            lines = cv2.HoughLinesP(edges, 1, np.pi/180, hough_threshold,
+                                    minLineLength=50 * scale, maxLineGap=10 * scale)
         
         camera_movements = []
         
         if lines is not None:
-            # Find dominant lines for camera movement guidance
-            lines_list = lines.tolist() if hasattr(lines, 'tolist') else lines
-            horizontal_lines = [line for line in lines_list if abs(line[0][3] - line[0][1]) < 20]
-            vertical_lines = [line for line in lines_list if abs(line[0][2] - line[0][0]) < 20]
-            
-            # Create sets for comparison to avoid array issues
-            horizontal_set = set(tuple(line[0]) for line in horizontal_lines)
-            vertical_set = set(tuple(line[0]) for line in vertical_lines)
+            # Classify segments as (x1, y1, x2, y2) rows; OpenCV returns
+            # either (N, 1, 4) or (N, 4) depending on version
+            segments = np.asarray(lines).reshape(-1, 4)
+            tolerance = 20 * scale
+            horizontal_mask = np.abs(segments[:, 3] - segments[:, 1]) < tolerance
+            vertical_mask = np.abs(segments[:, 2] - segments[:, 0]) < tolerance
+            has_diagonal = not bool((horizontal_mask | vertical_mask).all())
+            has_horizontal = bool(horizontal_mask.any())
             
-            diagonal_lines = [line for line in lines_list 
-                            if tuple(line[0]) not in horizontal_set and tuple(line[0]) not in vertical_set]
-            
-            if diagonal_lines:
+            if has_diagonal:
                 camera_movements.append({
                     "type": "tracking_shot",
                     "direction": "along diagonal",
@@ -147,7 +399,7 @@ class MovementPredictor:
                     "confidence": 0.8
                 })
             
-            if horizontal_lines:
+            if has_horizontal:
                 camera_movements.append({
                     "type": "pan",
                     "direction": "horizontal",
@@ -173,17 +425,100 @@ class MovementPredictor:
         
         return camera_movements
     
-    def _analyze_environmental_motion(self, image: np.ndarray) -> List[Dict]:
-        """Analyze environmental elements for justified animation"""
-        predictions = []
+    def _analyze_environmental_motion(self, image: np.ndarray,
+                                      gray: Optional[np.ndarray] = None,
+                                      hsv: Optional[np.ndarray] = None,
+                                      pixel_scale: float = 1.0) -> List[Dict]:
+        """
+        Analyze environmental elements for justified animation
+        
+        ``pixel_scale`` is the full-resolution area covered by one pixel of
+        ``image`` when it was decoded at reduced size.
+        """
+        _load_cv()
         
         # Analyze lighting and atmosphere
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        if gray is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        
+        # Scene-level statistics are stable under sub-sampling, so read
+        # every 4th pixel in each direction (1/16 of the memory traffic)
+        hsv_sample = hsv[::ENV_SAMPLE_STRIDE, ::ENV_SAMPLE_STRIDE]
+        gray_sample = gray[::ENV_SAMPLE_STRIDE, ::ENV_SAMPLE_STRIDE]
+        sample_scale = gray.size / gray_sample.size * pixel_scale
+        h, s, v = hsv_sample[..., 0], hsv_sample[..., 1], hsv_sample[..., 2]
         
         # Detect light sources and shadows
-        brightness = np.mean(hsv[:, :, 2])
+        brightness = float(v.mean())
+        
+        # Detect potential moving elements
+        # Look for elements that typically move (leaves, fabric, etc.)
+        # uint8 subtraction wraps hues below 35 past 85, so one compare
+        # covers the hue band; min(s, v) folds the two floor checks
+        green_mask = (h - np.uint8(35)) <= 50
+        green_mask &= np.minimum(s, v) >= 40
+        green_pixels = int(np.count_nonzero(green_mask) * sample_scale)
+        
+        # Check for fabric-like textures
+        # meanStdDev accumulates sum and sum of squares in one SIMD pass,
+        # where np.var makes two passes (mean, then squared deviations)
+        _, texture_std = cv2.meanStdDev(gray_sample)
+        texture_variance = float(texture_std[0, 0]) ** 2
         
-        if isinstance(brightness, (int, float, np.number)) and brightness > 200:
+        return self._environment_predictions(brightness, green_pixels, texture_variance)
+    
+    def analyze_batch(self, bgr_stack: np.ndarray) -> List[List[Dict]]:
+        """
+        Predict environmental motion for a stack of same-sized frames
+        
+        For callers that already hold decoded frames as one array (e.g.
+        video frames). ``analyze_images`` does not route through it: there
+        the environment stage reuses each image's prepared gray/HSV planes,
+        which is cheaper than stacking and re-converting the frames.
+        
+        Args:
+            bgr_stack: ``(N, H, W, 3)`` uint8 BGR frames
+            
+        Returns:
+            ``environment_animations`` list for each frame, in stack order
+        """
+        _load_cv()
+        frames, height, width = bgr_stack.shape[:3]
+        if frames == 0:
+            return []
+        
+        # Color conversion is per-pixel, so sample first and convert every
+        # frame in one call by laying the samples out as a single tall image
+        sample = np.ascontiguousarray(
+            bgr_stack[:, ::ENV_SAMPLE_STRIDE, ::ENV_SAMPLE_STRIDE]
+        )
+        sample_h, sample_w = sample.shape[1:3]
+        tall = sample.reshape(frames * sample_h, sample_w, 3)
+        hsv = cv2.cvtColor(tall, cv2.COLOR_BGR2HSV).reshape(frames, sample_h, sample_w, 3)
+        gray = cv2.cvtColor(tall, cv2.COLOR_BGR2GRAY).reshape(frames, sample_h * sample_w)
+        h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+        
+        # Per-frame reductions over the whole stack at once
+        brightness = v.mean(axis=(1, 2))
+        green_mask = (h - np.uint8(35)) <= 50
+        green_mask &= np.minimum(s, v) >= 40
+        sample_scale = (height * width) / (sample_h * sample_w)
+        green_pixels = np.count_nonzero(green_mask, axis=(1, 2)) * sample_scale
+        texture_variance = gray.var(axis=1, dtype=np.float64)
+        
+        return [
+            self._environment_predictions(float(b), int(g), float(t))
+            for b, g, t in zip(brightness, green_pixels, texture_variance)
+        ]
+    
+    def _environment_predictions(self, brightness: float, green_pixels: int,
+                                 texture_variance: float) -> List[Dict]:
+        """Map scene statistics to justified environmental animations"""
+        predictions = []
+        
+        if brightness > 200:
             # Bright scene - predict shadow movement
             predictions.append({
                 "element": "shadows",
@@ -192,12 +527,7 @@ class MovementPredictor:
                 "confidence": 0.7
             })
         
-        # Detect potential moving elements
-        # Look for elements that typically move (leaves, fabric, etc.)
-        green_mask = cv2.inRange(hsv, (35, 40, 40), (85, 255, 255))
-        green_pixels = cv2.countNonZero(green_mask)
-        
-        if isinstance(green_pixels, (int, np.integer)) and green_pixels > 1000:
+        if green_pixels > 1000:
             predictions.append({
                 "element": "vegetation",
                 "motion": "gentle swaying in breeze",
@@ -205,11 +535,7 @@ class MovementPredictor:
                 "confidence": 0.6
             })
         
-        # Check for fabric-like textures
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        texture_variance = np.var(gray)
-        
-        if isinstance(texture_variance, (int, float, np.number)) and texture_variance > 100:
+        if texture_variance > 100:
             predictions.append({
                 "element": "fabric/textiles",
                 "motion": "subtle movement from air currents",
@@ -221,28 +547,33 @@ class MovementPredictor:
     
     def _generate_movement_prompts(self, analysis: Dict) -> List[str]:
         """Generate comprehensive movement prompts based on analysis"""
-        prompts = []
+        predictions = analysis["movement_predictions"]
         
         # Character movement prompts
-        for char_move in analysis["movement_predictions"]["character_actions"]:
-            prompt = f"Character {char_move['predicted_action']} - {char_move['justification']}"
-            prompts.append(prompt)
+        prompts = [
+            f"Character {move['predicted_action']} - {move['justification']}"
+            for move in predictions["character_actions"]
+        ]
         
         # Camera movement prompts
-        for cam_move in analysis["movement_predictions"]["camera_movements"]:
-            prompt = f"Camera {cam_move['type']} {cam_move['direction']} - {cam_move['justification']}"
-            prompts.append(prompt)
+        prompts.extend(
+            f"Camera {move['type']} {move['direction']} - {move['justification']}"
+            for move in predictions["camera_movements"]
+        )
         
         # Environmental prompts
-        for env_move in analysis["movement_predictions"]["environment_animations"]:
-            prompt = f"{env_move['element']} {env_move['motion']} - {env_move['justification']}"
-            prompts.append(prompt)
+        prompts.extend(
+            f"{move['element']} {move['motion']} - {move['justification']}"
+            for move in predictions["environment_animations"]
+        )
         
         # Combined cinematic prompt
         if prompts:
-            combined_prompt = "Cinematic sequence: " + "; ".join(prompts[:3]) + \
-                        " - all movements must be subtle, justified, and serve the narrative"
-            prompts.insert(0, combined_prompt)
+            combined_prompt = (
+                f"Cinematic sequence: {'; '.join(prompts[:3])}"
+                " - all movements must be subtle, justified, and serve the narrative"
+            )
+            prompts = [combined_prompt, *prompts]
         
         return prompts
     
@@ -258,20 +589,13 @@ class MovementPredictor:
             True if movement is justified
         """
         # Check against must_do rules
-        if not movement.get('justification'):
+        justification = movement.get('justification')
+        if not justification:
             return False
         
         # Basic physics validation
-        if 'gravity' in movement.get('justification', '').lower():
-            return True
-        
-        if 'natural' in movement.get('justification', '').lower():
-            return True
-        
-        if 'composition' in movement.get('justification', '').lower():
-            return True
-        
-        return False
+        justification = justification.casefold()
+        return any(keyword in justification for keyword in JUSTIFICATION_KEYWORDS)
     
     def save_analysis(self, analysis: Dict, output_path: str) -> bool:
         """Save analysis results to JSON file"""
@@ -279,8 +603,11 @@ class MovementPredictor:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                output_path.write_bytes(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(analysis, f, indent=2, ensure_ascii=False)
             
             return True
         except Exception as e:
@@ -6,12 +6,58 @@ Optimized for minimal dependencies
 
 import cv2
 import numpy as np
-from PIL import Image, ImageStat
+from PIL import Image
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+
+# HSV colour ranges shared by object detection and scene classification.
+# Order matters: masks are stacked along axis 0 in this order.
+COLOR_RANGES = {
+    "sky": ((100, 50, 50), (130, 255, 255)),
+    "vegetation": ((35, 50, 50), (85, 255, 255)),
+    "building": ((0, 0, 50), (180, 50, 200)),
+    "water": ((100, 50, 50), (140, 255, 255)),
+    "ground": ((10, 50, 50), (35, 255, 255)),
+}
+COLOR_CLASSES = tuple(COLOR_RANGES)
+SCENE_CLASSES = ("sky", "vegetation", "building", "water")
+
+# Side length of the grayscale thumbnail used for symmetry scoring
+SYMMETRY_SIZE = 256
+
+
+@dataclass
+class ImageContext:
+    """Per-image intermediates computed once and shared by every analysis stage
+
+    ``hsv`` and ``masks`` may be at a reduced resolution (see
+    ``analysis_max_side``); the gray and gradient planes are always full size.
+    """
+    bgr: np.ndarray
+    gray: np.ndarray
+    hsv: np.ndarray
+    sobel_x: np.ndarray
+    sobel_y: np.ndarray
+    gradient_magnitude: np.ndarray
+    masks: np.ndarray
+
+
+def _analyze_image_in_worker(config: Dict, image_path: str) -> Dict:
+    """Process-pool entry point; receives the plain config rather than a pickled analyzer"""
+    analyzer = SceneAnalyzer()
+    # The pool already spreads images across cores; skip per-image stage threads
+    analyzer.config = dict(config, stage_workers=1)
+    return analyzer.analyze_image(image_path)
+
 
 class SceneAnalyzer:
     """
@@ -20,18 +66,35 @@ class SceneAnalyzer:
     without heavy dependencies
     """
     
+    # COLOR_RANGES bounds packed once into contiguous uint8 arrays (one row
+    # per class) so inRange gets ready-made bounds instead of fresh tuples
+    _COLOR_LOWERS = np.array([COLOR_RANGES[c][0] for c in COLOR_CLASSES], dtype=np.uint8)
+    _COLOR_UPPERS = np.array([COLOR_RANGES[c][1] for c in COLOR_CLASSES], dtype=np.uint8)
+    
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
         self.logger = logging.getLogger(__name__)
         
-        # Analysis cache
-        self.analysis_cache = {}
+        # Bounded LRU analysis cache keyed by (realpath, mtime_ns, size)
+        self.analysis_cache = OrderedDict()
+        
+        # Per-thread reusable image buffers for _build_context
+        self._scratch = threading.local()
+        
+        # Stage thread pool, started on first concurrent analysis and reused
+        self._stage_executor = None
+        self._stage_executor_lock = threading.Lock()
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration for scene analysis"""
         default_config = {
             "confidence_threshold": 0.5,
             "max_objects": 20,
+            "cache_enabled": True,
+            "cache_size": 256,
+            "batch_workers": None,
+            "analysis_max_side": 1024,
+            "stage_workers": None,
             "composition_weights": {
                 "rule_of_thirds": 0.3,
                 "symmetry": 0.3,
@@ -65,23 +128,43 @@ class SceneAnalyzer:
         Returns:
             Dictionary containing all analysis results
         """
-        if image_path in self.analysis_cache:
-            return self.analysis_cache[image_path]
-        
         try:
-            # Load image
-            image = Image.open(image_path)
-            cv_image = cv2.imread(image_path)
+            cache_key = self._cache_key(image_path)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Decode pixels once with OpenCV; PIL.Image.open is lazy and only
+            # parses the header for mode/format metadata
+            cv_image = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
             
             if cv_image is None:
                 raise ValueError(f"Could not load image: {image_path}")
             
-            # Perform analysis
-            image_info = self._get_image_info(image)
-            objects = self._detect_objects_fallback(cv_image)
-            depth = self._estimate_depth_fallback(cv_image)
-            composition = self._analyze_composition(cv_image)
-            scene_type = self._classify_scene(cv_image)
+            with Image.open(image_path) as image:
+                image_info = self._get_image_info(image, cv_image)
+            
+            # Colour ratios and colour-blob detection are scale invariant, so
+            # large inputs are segmented at a bounded size. Edge density,
+            # texture and depth statistics depend on resolution and are
+            # always measured on the full-size gray/gradient planes.
+            height, width = cv_image.shape[:2]
+            max_side = self.config.get("analysis_max_side")
+            scale = min(1.0, max_side / max(height, width)) if max_side else 1.0
+            color_image = cv_image
+            if scale < 1.0:
+                color_image = cv2.resize(cv_image, None, fx=scale, fy=scale,
+                                         interpolation=cv2.INTER_AREA)
+            
+            # Perform analysis; colour conversions, gradients and masks are
+            # computed once in the context and shared by every stage
+            ctx = self._build_context(cv_image, reuse_buffers=True, color_image=color_image)
+            objects, color_ratios, depth, composition = self._run_stages(ctx)
+            scene_type = self._classify_scene(ctx, color_ratios)
+            
+            # Report object geometry in original-image coordinates
+            if scale < 1.0:
+                self._rescale_objects(objects, 1.0 / scale)
             
             # Build analysis structure
             analysis = {
@@ -98,7 +181,7 @@ class SceneAnalyzer:
             analysis["aesthetics"] = self._calculate_aesthetics_score(analysis)
             
             # Cache results
-            self.analysis_cache[image_path] = analysis
+            self._cache_put(cache_key, analysis)
             
             return analysis
             
@@ -106,9 +189,36 @@ class SceneAnalyzer:
             self.logger.error(f"Failed to analyze image {image_path}: {e}")
             return self._get_error_analysis(str(e))
     
-    def _get_image_info(self, image: Image.Image) -> Dict:
+    def _cache_key(self, image_path: str) -> Tuple[str, int, int]:
+        """Cache key that changes whenever the file is edited or replaced"""
+        st = os.stat(image_path)
+        return (os.path.realpath(image_path), st.st_mtime_ns, st.st_size)
+    
+    def _cache_get(self, key: Tuple[str, int, int]) -> Optional[Dict]:
+        """Return a cached analysis and mark it most recently used"""
+        analysis = self.analysis_cache.get(key)
+        if analysis is not None:
+            self.analysis_cache.move_to_end(key)
+        return analysis
+    
+    def _cache_put(self, key: Tuple[str, int, int], analysis: Dict):
+        """Store an analysis, evicting the least recently used entries"""
+        if not self.config.get("cache_enabled", True):
+            return
+        
+        self.analysis_cache[key] = analysis
+        self.analysis_cache.move_to_end(key)
+        while len(self.analysis_cache) > self.config["cache_size"]:
+            self.analysis_cache.popitem(last=False)
+    
+    def _get_image_info(self, image: Image.Image,
+                        cv_image: Optional[np.ndarray] = None) -> Dict:
         """Extract basic image information"""
-        stat = ImageStat.Stat(image)
+        # Brightness statistics come from a single OpenCV pass over the
+        # decoded pixels; the PIL image only supplies header metadata
+        if cv_image is None:
+            cv_image = np.asarray(image)
+        mean, std = cv2.meanStdDev(cv_image)
         
         return {
             "width": image.width,
@@ -116,128 +226,235 @@ class SceneAnalyzer:
             "mode": image.mode,
             "format": image.format,
             "aspect_ratio": round(image.width / image.height, 3),
-            "mean_brightness": sum(stat.mean) / len(stat.mean),
-            "std_dev": sum(stat.stddev) / len(stat.stddev)
+            "mean_brightness": float(mean.mean()),
+            "std_dev": float(std.mean())
         }
     
-    def _detect_objects_fallback(self, image: np.ndarray) -> List[Dict]:
-        """Object detection using color segmentation and contour detection"""
-        objects = []
+    def _scratch_like(self, shape: Tuple[int, ...], dtype, key: str) -> np.ndarray:
+        """Return this thread's reusable buffer for ``key``, reallocating on shape change"""
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        
+        buf = buffers.get(key)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = buffers[key] = np.empty(shape, dtype=dtype)
+        return buf
+    
+    def _build_context(self, image: np.ndarray, reuse_buffers: bool = False,
+                       color_image: Optional[np.ndarray] = None) -> ImageContext:
+        """
+        Compute the shared per-image intermediates for the analysis stages
+        
+        With ``reuse_buffers`` the planes are written into per-thread scratch
+        buffers, so the context is only valid until the next reusing build
+        on the same thread (analyze_image keeps nothing but derived values).
+        ``color_image`` (default ``image``) is the possibly downscaled copy
+        the HSV planes and colour masks are computed from.
+        """
         height, width = image.shape[:2]
+        if color_image is None:
+            color_image = image
+        color_height, color_width = color_image.shape[:2]
+        if reuse_buffers:
+            alloc = self._scratch_like
+        else:
+            alloc = lambda shape, dtype, key: np.empty(shape, dtype=dtype)
+        
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY,
+                            dst=alloc((height, width), np.uint8, "gray"))
+        hsv = cv2.cvtColor(color_image, cv2.COLOR_BGR2HSV,
+                           dst=alloc((color_height, color_width, 3), np.uint8, "hsv"))
+        
+        # One fused 3x3 Sobel pass yields both int16 gradients
+        sobel_x, sobel_y = cv2.spatialGradient(
+            gray,
+            dx=alloc((height, width), np.int16, "sobel_x"),
+            dy=alloc((height, width), np.int16, "sobel_y"),
+            borderType=cv2.BORDER_REPLICATE
+        )
+        
+        # cv2.magnitude needs float input; widen the gradients into float32
+        # buffers and compute the magnitude in place
+        grad_x = alloc((height, width), np.float32, "grad_x")
+        grad_y = alloc((height, width), np.float32, "grad_y")
+        np.copyto(grad_x, sobel_x)
+        np.copyto(grad_y, sobel_y)
+        
+        return ImageContext(
+            bgr=image,
+            gray=gray,
+            hsv=hsv,
+            sobel_x=sobel_x,
+            sobel_y=sobel_y,
+            gradient_magnitude=cv2.magnitude(grad_x, grad_y, grad_x),
+            masks=self._compute_color_masks(
+                hsv, alloc((len(COLOR_CLASSES), color_height, color_width), np.uint8, "masks"))
+        )
+    
+    def _run_stages(self, ctx: ImageContext) -> Tuple[List[Dict], Dict[str, float], Dict, Dict]:
+        """Run the independent analysis stages, concurrently when configured"""
+        # The stages only read the shared context and spend their time in
+        # OpenCV calls that release the GIL, so threads overlap them
+        workers = min(self.config.get("stage_workers") or os.cpu_count() or 1, 3)
+        if workers <= 1:
+            objects, color_ratios = self._detect_objects_and_ratios(ctx)
+            return (objects, color_ratios,
+                    self._estimate_depth_fallback(ctx), self._analyze_composition(ctx))
+        
+        executor = self._get_stage_executor(workers)
+        detection = executor.submit(self._detect_objects_and_ratios, ctx)
+        depth = executor.submit(self._estimate_depth_fallback, ctx)
+        composition = executor.submit(self._analyze_composition, ctx)
+        objects, color_ratios = detection.result()
+        return objects, color_ratios, depth.result(), composition.result()
+    
+    def _get_stage_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Return the analyzer's stage thread pool, starting it on first use"""
+        with self._stage_executor_lock:
+            if self._stage_executor is None:
+                self._stage_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="scene-stage"
+                )
+            return self._stage_executor
+    
+    def close(self):
+        """Shut down the stage thread pool (restarted on next use)"""
+        with self._stage_executor_lock:
+            executor, self._stage_executor = self._stage_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def __enter__(self) -> "SceneAnalyzer":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _as_context(self, image: Union[np.ndarray, ImageContext]) -> ImageContext:
+        """Accept either a prepared context or a raw BGR image"""
+        if isinstance(image, ImageContext):
+            return image
+        return self._build_context(image)
+    
+    def _compute_color_masks(self, hsv: np.ndarray,
+                             masks: Optional[np.ndarray] = None) -> np.ndarray:
+        """Threshold every COLOR_RANGES entry into one (K, H, W) uint8 stack"""
+        if masks is None:
+            height, width = hsv.shape[:2]
+            masks = np.empty((len(COLOR_CLASSES), height, width), dtype=np.uint8)
         
-        # Convert to HSV for better color segmentation
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        for k in range(len(COLOR_CLASSES)):
+            cv2.inRange(hsv, self._COLOR_LOWERS[k], self._COLOR_UPPERS[k], dst=masks[k])
         
-        # Define color ranges for common objects
-        color_ranges = {
-            "sky": [(100, 50, 50), (130, 255, 255)],
-            "vegetation": [(35, 50, 50), (85, 255, 255)],
-            "building": [(0, 0, 50), (180, 50, 200)],
-            "water": [(100, 50, 50), (140, 255, 255)],
-            "ground": [(10, 50, 50), (35, 255, 255)]
-        }
+        return masks
+    
+    def _detect_objects_fallback(self, image: Union[np.ndarray, ImageContext]) -> List[Dict]:
+        """Object detection using color segmentation and connected components"""
+        objects, _ = self._detect_objects_and_ratios(self._as_context(image))
+        return objects
+    
+    def _detect_objects_and_ratios(self, ctx: ImageContext) -> Tuple[List[Dict], Dict[str, float]]:
+        """Detect colour objects and, as a byproduct, each class's pixel ratio"""
+        objects = []
+        ratios = {}
+        height, width = ctx.masks.shape[1:]
+        total_pixels = width * height
+        min_area = total_pixels * 0.01  # Filter small objects
         
-        for obj_class, (lower, upper) in color_ranges.items():
-            mask = cv2.inRange(hsv, lower, upper)
+        for obj_class, mask in zip(COLOR_CLASSES, ctx.masks):
+            # Label colour blobs; each stats row already holds the bbox and
+            # pixel area (row 0 is the background)
+            _, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+            stats = stats[1:]
             
-            # Find contours
-            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            # Blob areas partition the mask, so their sum is its pixel count
+            ratios[obj_class] = int(stats[:, cv2.CC_STAT_AREA].sum()) / total_pixels
+            stats = stats[stats[:, cv2.CC_STAT_AREA] > min_area]
             
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > (width * height * 0.01):  # Filter small objects
-                    x, y, w, h = cv2.boundingRect(contour)
-                    confidence = min(area / (width * height), 1.0)
-                    
-                    objects.append({
-                        "class": obj_class,
-                        "confidence": round(confidence, 2),
-                        "bbox": [x, y, w, h],
-                        "center": [x + w//2, y + h//2],
-                        "area": area
-                    })
-        
-        # Sort by confidence and limit to max_objects
-        objects.sort(key=lambda x: x["confidence"], reverse=True)
-        return objects[:self.config["max_objects"]]
+            for x, y, w, h, area in stats.tolist():
+                confidence = min(area / total_pixels, 1.0)
+                
+                objects.append({
+                    "class": obj_class,
+                    "confidence": round(confidence, 2),
+                    "bbox": [x, y, w, h],
+                    "center": [x + w//2, y + h//2],
+                    "area": area
+                })
+        
+        return self._top_objects(objects, self.config["max_objects"]), ratios
+    
+    def _top_objects(self, objects: List[Dict], max_objects: int) -> List[Dict]:
+        """Highest-confidence objects in descending order, ties in detection order"""
+        if max_objects <= 0:
+            return []
+        if len(objects) <= max_objects:
+            return sorted(objects, key=lambda x: x["confidence"], reverse=True)
+        
+        # Select the top K in O(N) with a partition instead of sorting every
+        # blob: everything above the K-th confidence, then enough of the ties
+        confs = np.fromiter((obj["confidence"] for obj in objects),
+                            dtype=np.float64, count=len(objects))
+        kth = np.partition(confs, -max_objects)[-max_objects]
+        above = np.flatnonzero(confs > kth)
+        ties = np.flatnonzero(confs == kth)[:max_objects - len(above)]
+        
+        idx = np.sort(np.concatenate((above, ties)))
+        idx = idx[np.argsort(-confs[idx], kind="stable")]
+        return [objects[i] for i in idx]
     
-    def _estimate_depth_fallback(self, image: np.ndarray) -> Dict:
+    def _estimate_depth_fallback(self, image: Union[np.ndarray, ImageContext]) -> Dict:
         """Depth estimation using image gradients and edge analysis"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Calculate gradients
-        grad_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        grad_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+        ctx = self._as_context(image)
         
-        # Gradient magnitude as depth proxy
-        gradient_magnitude = np.sqrt(grad_x**2 + grad_y**2)
+        # Gradient magnitude as depth proxy, normalized to 0-1 range; the
+        # context is shared with other stages, so write to a fresh buffer
+        gradient_norm = cv2.normalize(ctx.gradient_magnitude, None, 0, 1, cv2.NORM_MINMAX)
         
-        # Normalize to 0-1 range
-        gradient_norm = (gradient_magnitude - gradient_magnitude.min()) / (gradient_magnitude.max() - gradient_magnitude.min())
-        
-        # Create depth map (inverted: high gradient = near, low gradient = far)
-        depth_map = 1.0 - gradient_norm
+        # The depth map is 1 - gradient_norm (high gradient = near, low
+        # gradient = far), so its statistics follow directly from two fused
+        # reductions over gradient_norm without materializing the map
+        norm_min, norm_max, _, _ = cv2.minMaxLoc(gradient_norm)
+        norm_mean, norm_std = cv2.meanStdDev(gradient_norm)
+        norm_mean = float(norm_mean[0, 0])
+        norm_std = float(norm_std[0, 0])
         
         return {
             "method": "gradient_depth",
-            "min_depth": float(depth_map.min()),
-            "max_depth": float(depth_map.max()),
-            "mean_depth": float(depth_map.mean()),
-            "depth_variance": float(depth_map.var()),
-            "depth_complexity": float(np.std(gradient_norm))
+            "min_depth": 1.0 - norm_max,
+            "max_depth": 1.0 - norm_min,
+            "mean_depth": 1.0 - norm_mean,
+            "depth_variance": norm_std ** 2,
+            "depth_complexity": norm_std
         }
     
-    def _analyze_composition(self, image: np.ndarray) -> Dict:
+    def _analyze_composition(self, image: Union[np.ndarray, ImageContext]) -> Dict:
         """Analyze image composition using OpenCV"""
-        height, width = image.shape[:2]
-        
-        # Rule of thirds analysis
-        third_width = width // 3
-        third_height = height // 3
-        
-        # Edge detection for leading lines
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        
-        # Symmetry analysis
-        left_half = image[:, :width//2]
-        right_half = image[:, width//2:]
-        right_half_flipped = cv2.flip(right_half, 1)
+        ctx = self._as_context(image)
+        gray = ctx.gray
+        height, width = gray.shape
         
-        # Calculate symmetry score
-        left_gray = cv2.cvtColor(left_half, cv2.COLOR_BGR2GRAY)
-        right_gray = cv2.cvtColor(right_half_flipped, cv2.COLOR_BGR2GRAY)
+        # Symmetry is a low-frequency property, so score it on a small fixed
+        # size thumbnail. |img - mirror(img)| is itself mirror-symmetric, so
+        # its mean over the whole frame equals the mean over one half.
+        small_gray = cv2.resize(gray, (SYMMETRY_SIZE, SYMMETRY_SIZE), interpolation=cv2.INTER_AREA)
         
-        # Resize to same dimensions
-        if left_gray.shape != right_gray.shape:
-            right_gray = cv2.resize(right_gray, (left_gray.shape[1], left_gray.shape[0]))
-        
-        diff = cv2.absdiff(left_gray, right_gray)
-        symmetry_score = 1.0 - (np.mean(diff) / 255.0)
+        diff = cv2.absdiff(small_gray, cv2.flip(small_gray, 1))
+        symmetry_score = 1.0 - cv2.mean(diff)[0] / 255.0
         
         # Vertical symmetry
-        top_half = image[:height//2, :]
-        bottom_half = image[height//2:, :]
-        bottom_flipped = cv2.flip(bottom_half, 0)
-        
-        top_gray = cv2.cvtColor(top_half, cv2.COLOR_BGR2GRAY)
-        bottom_gray = cv2.cvtColor(bottom_flipped, cv2.COLOR_BGR2GRAY)
-        
-        if top_gray.shape != bottom_gray.shape:
-            bottom_gray = cv2.resize(bottom_gray, (top_gray.shape[1], top_gray.shape[0]))
+        vert_diff = cv2.absdiff(small_gray, cv2.flip(small_gray, 0))
+        vertical_symmetry = 1.0 - cv2.mean(vert_diff)[0] / 255.0
         
-        vert_diff = cv2.absdiff(top_gray, bottom_gray)
-        vertical_symmetry = 1.0 - (np.mean(vert_diff) / 255.0)
-        
-        # Edge density for complexity
-        edge_density = float(np.sum(edges > 0) / (width * height))
+        # Edge density for complexity; Canny accepts the shared int16 Sobel
+        # gradients directly (replicate border matches its internal Sobel)
+        edges = cv2.Canny(ctx.sobel_x, ctx.sobel_y, 50, 150)
+        edge_pixels = cv2.countNonZero(edges)
+        edge_density = edge_pixels / (width * height)
         
         return {
-            "rule_of_thirds": {
-                "grid": [[0, third_width, 2*third_width], [0, third_height, 2*third_height]],
-                "key_points": [[third_width, third_height], [2*third_width, third_height], 
-                             [third_width, 2*third_height], [2*third_width, 2*third_height]]
-            },
+            "rule_of_thirds": self._rule_of_thirds_grid(width, height),
             "symmetry": {
                 "horizontal_symmetry": round(symmetry_score, 3),
                 "vertical_symmetry": round(vertical_symmetry, 3)
@@ -248,35 +465,47 @@ class SceneAnalyzer:
             }
         }
     
+    def _rule_of_thirds_grid(self, width: int, height: int) -> Dict:
+        """Rule of thirds grid lines and intersection points"""
+        third_width = width // 3
+        third_height = height // 3
+        
+        return {
+            "grid": [[0, third_width, 2*third_width], [0, third_height, 2*third_height]],
+            "key_points": [[third_width, third_height], [2*third_width, third_height], 
+                         [third_width, 2*third_height], [2*third_width, 2*third_height]]
+        }
+    
+    def _rescale_objects(self, objects: List[Dict], factor: float):
+        """Map object geometry from the analysis resolution back to the original"""
+        for obj in objects:
+            x, y, w, h = (int(round(v * factor)) for v in obj["bbox"])
+            obj["bbox"] = [x, y, w, h]
+            obj["center"] = [x + w//2, y + h//2]
+            obj["area"] = obj["area"] * factor * factor
+    
     def _calculate_texture_complexity(self, gray_image: np.ndarray) -> float:
         """Calculate texture complexity using local standard deviation"""
-        # Calculate local standard deviation
-        kernel = np.ones((5, 5), np.float32) / 25
-        local_mean = cv2.filter2D(gray_image.astype(np.float32), -1, kernel)
-        local_mean_sq = cv2.filter2D((gray_image.astype(np.float32) ** 2), -1, kernel)
-        local_var = local_mean_sq - (local_mean ** 2)
+        # Calculate local standard deviation with separable box filters that
+        # read uint8 and accumulate in float32; sqrBoxFilter averages the
+        # squared pixels without materializing a squared copy
+        local_mean = cv2.boxFilter(gray_image, cv2.CV_32F, (5, 5))
+        local_mean_sq = cv2.sqrBoxFilter(gray_image, cv2.CV_32F, (5, 5))
         
-        return float(np.sqrt(np.mean(local_var)))
+        # var = E[x^2] - E[x]^2, evaluated in place in the float32 buffers
+        cv2.multiply(local_mean, local_mean, dst=local_mean)
+        local_var = cv2.subtract(local_mean_sq, local_mean, dst=local_mean_sq)
+        
+        return float(np.sqrt(cv2.mean(local_var)[0]))
     
-    def _classify_scene(self, image: np.ndarray) -> Dict:
+    def _classify_scene(self, image: Union[np.ndarray, ImageContext],
+                        color_ratios: Optional[Dict[str, float]] = None) -> Dict:
         """Classify the scene type based on visual features"""
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        height, width = image.shape[:2]
-        total_pixels = width * height
-        
-        # Color-based classification
-        color_ranges = {
-            "sky": [(100, 50, 50), (130, 255, 255)],
-            "vegetation": [(35, 50, 50), (85, 255, 255)],
-            "building": [(0, 0, 50), (180, 50, 200)],
-            "water": [(100, 50, 50), (140, 255, 255)]
-        }
-        
-        ratios = {}
-        for scene_type, (lower, upper) in color_ranges.items():
-            mask = cv2.inRange(hsv, lower, upper)
-            pixel_count = cv2.countNonZero(mask)
-            ratios[scene_type] = pixel_count / total_pixels
+        # Color-based classification; the ratios normally arrive as a
+        # byproduct of object detection over the same masks
+        if color_ratios is None:
+            _, color_ratios = self._detect_objects_and_ratios(self._as_context(image))
+        ratios = {scene_type: color_ratios[scene_type] for scene_type in SCENE_CLASSES}
         
         # Determine dominant scene type
         thresholds = self.config["scene_thresholds"]
@@ -357,29 +586,29 @@ class SceneAnalyzer:
         height = image_info["height"]
         
         # Rule of thirds intersection points
-        third_points = [
+        third_points = np.array([
             (width // 3, height // 3),
             (2 * width // 3, height // 3),
             (width // 3, 2 * height // 3),
             (2 * width // 3, 2 * height // 3)
-        ]
+        ], dtype=np.float64)
         
-        score = 0.0
-        for obj in objects:
-            center = obj["center"]
-            
-            # Find closest third point
-            min_distance = float('inf')
-            for point in third_points:
-                distance = np.sqrt((center[0] - point[0])**2 + (center[1] - point[1])**2)
-                min_distance = min(min_distance, distance)
-            
-            # Convert distance to score (closer = higher score)
-            max_distance = np.sqrt(width**2 + height**2) / 6
-            obj_score = max(0, 1 - (min_distance / max_distance))
-            score += obj_score * obj["confidence"]
+        centers = np.array([obj["center"] for obj in objects], dtype=np.float64)
+        confidences = np.fromiter((obj["confidence"] for obj in objects),
+                                  dtype=np.float64, count=len(objects))
+        
+        # Distance from every object to its closest third point, shape (N,).
+        # The minimum is taken over squared distances; sqrt is monotonic, so
+        # it only needs to run once per object instead of once per pair.
+        offsets = centers[:, None, :] - third_points[None, :, :]
+        min_sq_distances = np.einsum("npk,npk->np", offsets, offsets).min(axis=1)
+        min_distances = np.sqrt(min_sq_distances)
+        
+        # Convert distance to score (closer = higher score)
+        max_distance = np.sqrt(width**2 + height**2) / 6
+        scores = np.clip(1 - min_distances / max_distance, 0, None) * confidences
         
-        return score / len(objects) if objects else 0.0
+        return float(scores.mean())
     
     def save_analysis(self, analysis: Dict, output_path: str):
         """Save analysis results to JSON file"""
@@ -404,24 +633,31 @@ class SceneAnalyzer:
         }
         
         image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
+        image_files = [p for p in image_dir.iterdir() if p.suffix.lower() in image_extensions]
+        results["total_images"] = len(image_files)
+        
+        # Analyses are CPU-bound and independent, so fan them out across
+        # processes; a single image (or one worker) stays in-process
+        workers = self.config.get("batch_workers") or os.cpu_count() or 1
+        if workers > 1 and len(image_files) > 1:
+            worker_fn = partial(_analyze_image_in_worker, self.config)
+            with ProcessPoolExecutor(max_workers=min(workers, len(image_files))) as executor:
+                analyses = list(executor.map(worker_fn, map(str, image_files), chunksize=4))
+        else:
+            analyses = [self.analyze_image(str(p)) for p in image_files]
         
-        for image_file in image_dir.iterdir():
-            if image_file.suffix.lower() in image_extensions:
-                results["total_images"] += 1
+        for image_file, analysis in zip(image_files, analyses):
+            try:
+                # Save individual analysis
+                output_file = output_dir / f"{image_file.stem}_analysis.json"
+                self.save_analysis(analysis, str(output_file))
                 
-                try:
-                    analysis = self.analyze_image(str(image_file))
-                    
-                    # Save individual analysis
-                    output_file = output_dir / f"{image_file.stem}_analysis.json"
-                    self.save_analysis(analysis, str(output_file))
-                    
-                    results["analyses"][str(image_file)] = analysis
-                    results["successful_analyses"] += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to analyze {image_file}: {e}")
-                    results["failed_analyses"] += 1
+                results["analyses"][str(image_file)] = analysis
+                results["successful_analyses"] += 1
+                
+            except Exception as e:
+                self.logger.error(f"Failed to analyze {image_file}: {e}")
+                results["failed_analyses"] += 1
         
         return results
     
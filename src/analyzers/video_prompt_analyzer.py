@@ -5,11 +5,20 @@ Analyzes and structures prompts for various AI video generation models,
 ensuring optimal temporal consistency and multi-scene coherence.
 """
 
-import json
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+import os
+import sys
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Mapping, Iterable
+from dataclasses import dataclass, replace
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ModelType(Enum):
     """Supported AI video generation models"""
@@ -27,44 +36,64 @@ class ModelType(Enum):
     STABLE_VIDEO_DIFFUSION = "stable_video_diffusion"
 
 
-@dataclass
+# Plain dict from member to catalog key, cheaper than ``.value`` per call
+_MT_VALUE = {mt: mt.value for mt in ModelType}
+
+
+# Validation bounds for TemporalConsistencyConfig
+_TEMPORAL_WEIGHT_RANGE = (0.0, 1.0)
+_MOTION_STRENGTH_RANGE = (0.0, 1.0)
+_GUIDANCE_SCALE_RANGE = (1.0, 20.0)
+_ALLOWED_FPS = frozenset({24, 30, 60})
+
+
+@dataclass(frozen=True)
 class TemporalConsistencyConfig:
-    """Configuration for temporal consistency parameters"""
+    """Configuration for temporal consistency parameters
+    
+    Immutable, so one instance can be shared between scenes; derive variants
+    with ``dataclasses.replace``.
+    """
     seed: Optional[int] = None
     temporal_weight: float = 0.8
     motion_strength: float = 0.5
     frame_interpolation: int = 24
     guidance_scale: float = 7.5
     
+    def _iter_errors(self):
+        """Yield a message for each parameter outside its allowed range"""
+        low, high = _TEMPORAL_WEIGHT_RANGE
+        if not low <= self.temporal_weight <= high:
+            yield "temporal_weight must be between 0.0 and 1.0"
+        
+        low, high = _MOTION_STRENGTH_RANGE
+        if not low <= self.motion_strength <= high:
+            yield "motion_strength must be between 0.0 and 1.0"
+        
+        if self.frame_interpolation not in _ALLOWED_FPS:
+            yield "frame_interpolation must be 24, 30, or 60 fps"
+        
+        low, high = _GUIDANCE_SCALE_RANGE
+        if not low <= self.guidance_scale <= high:
+            yield "guidance_scale must be between 1.0 and 20.0"
+    
     def validate(self) -> Tuple[bool, List[str]]:
         """Validate temporal consistency configuration"""
-        errors = []
-        
-        if self.temporal_weight < 0.0 or self.temporal_weight > 1.0:
-            errors.append("temporal_weight must be between 0.0 and 1.0")
-        
-        if self.motion_strength < 0.0 or self.motion_strength > 1.0:
-            errors.append("motion_strength must be between 0.0 and 1.0")
-        
-        if self.frame_interpolation not in [24, 30, 60]:
-            errors.append("frame_interpolation must be 24, 30, or 60 fps")
-        
-        if self.guidance_scale < 1.0 or self.guidance_scale > 20.0:
-            errors.append("guidance_scale must be between 1.0 and 20.0")
-        
-        return len(errors) == 0, errors
+        errors = list(self._iter_errors())
+        return not errors, errors
 
 
-@dataclass
+@dataclass(frozen=True)
 class CameraMotion:
-    """Camera motion configuration"""
+    """Camera motion configuration (immutable, so the prompt string is cached)"""
     type: str = "static"  # static, pan, tilt, zoom, dolly, orbit, crane
     speed: str = "medium"  # slow, medium, fast
     direction: Optional[str] = None  # left, right, up, down, in, out
     focal_length: Optional[int] = 50  # mm
     
-    def to_prompt_string(self) -> str:
-        """Convert camera motion to prompt string"""
+    @cached_property
+    def prompt_string(self) -> str:
+        """Camera motion as a prompt string, built once per instance"""
         if self.type == "static":
             return "Camera static, no movement"
         
@@ -79,17 +108,43 @@ class CameraMotion:
             motion_desc += f", {self.focal_length}mm focal length"
         
         return motion_desc
+    
+    def to_prompt_string(self) -> str:
+        """Convert camera motion to prompt string"""
+        return self.prompt_string
 
 
-@dataclass
+@dataclass(frozen=True)
 class SceneTransition:
-    """Scene transition configuration"""
+    """Scene transition configuration (immutable, so the prompt string is cached)"""
     type: str = "fade"  # fade, cut, dissolve
     duration: float = 0.5  # seconds
     
+    @cached_property
+    def prompt_string(self) -> str:
+        """Transition as a prompt string, built once per instance"""
+        return f"Transition: {self.type} over {self.duration}s"
+    
     def to_prompt_string(self) -> str:
         """Convert transition to prompt string"""
-        return f"Transition: {self.type} over {self.duration}s"
+        return self.prompt_string
+
+
+# Shared default for scenes created without an explicit temporal config
+DEFAULT_TEMPORAL_CONFIG = TemporalConsistencyConfig()
+
+
+# Model-specific prompt templates, pre-bound to str.format for dispatch by model
+_PROMPT_FORMATS = {
+    ModelType.KLING: "{subject} {action} in {environment} lit by {lighting}, creating {atmosphere}. {camera}. {style}".format,
+    ModelType.WAN: "{subject}: {environment} -> {action} with {atmosphere}. {camera}. Style: {style}".format,
+    ModelType.SORA2: "Scene: {subject} {action} in {environment}. Lighting: {lighting}. Atmosphere: {atmosphere}. {camera}. Visual style: {style}".format,
+    ModelType.LUMA: "{camera} showing {subject} {action} in {environment}. {lighting} creates {atmosphere}. Cinematic {style}".format,
+}
+_GENERIC_PROMPT_FORMAT = "{subject} {action} {environment} {lighting} {atmosphere} {camera} {style}".format
+
+# Free-text PromptStructure fields interned on construction
+_INTERNED_FIELDS = ("subject", "action", "environment", "lighting", "atmosphere", "style")
 
 
 @dataclass
@@ -102,76 +157,222 @@ class PromptStructure:
     atmosphere: str
     camera: CameraMotion
     style: str
-    temporal_config: TemporalConsistencyConfig = field(default_factory=TemporalConsistencyConfig)
+    temporal_config: TemporalConsistencyConfig = DEFAULT_TEMPORAL_CONFIG
+    
+    def __post_init__(self):
+        # Scenes in a plan usually repeat the same phrases; interning them
+        # shares one object per phrase and lets set/equality checks in
+        # generate_multi_scene_plan short-circuit on identity
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
     
     def to_prompt(self, model_type: ModelType) -> str:
         """Convert structure to model-specific prompt"""
-        camera_str = self.camera.to_prompt_string()
-        
-        # Model-specific formatting
-        if model_type == ModelType.KLING:
-            return f"{self.subject} {self.action} in {self.environment} lit by {self.lighting}, creating {self.atmosphere}. {camera_str}. {self.style}"
-        
-        elif model_type == ModelType.WAN:
-            return f"{self.subject}: {self.environment} -> {self.action} with {self.atmosphere}. {camera_str}. Style: {self.style}"
-        
-        elif model_type == ModelType.SORA2:
-            return f"Scene: {self.subject} {self.action} in {self.environment}. Lighting: {self.lighting}. Atmosphere: {self.atmosphere}. {camera_str}. Visual style: {self.style}"
-        
-        elif model_type == ModelType.LUMA:
-            return f"{camera_str} showing {self.subject} {self.action} in {self.environment}. {self.lighting} creates {self.atmosphere}. Cinematic {self.style}"
-        
-        else:
-            # Generic format
-            return f"{self.subject} {self.action} {self.environment} {self.lighting} {self.atmosphere} {camera_str} {self.style}"
+        # Model-specific formatting via a single table lookup
+        prompt_format = _PROMPT_FORMATS.get(model_type, _GENERIC_PROMPT_FORMAT)
+        return prompt_format(
+            subject=self.subject,
+            action=self.action,
+            environment=self.environment,
+            lighting=self.lighting,
+            atmosphere=self.atmosphere,
+            camera=self.camera.prompt_string,
+            style=self.style
+        )
+
+
+# ANIMAtiZE movement rules per camera motion type
+_COMPOSITION_FLOW_RULES = (
+    "movement_002: Composition-Guided Camera Flow",
+    "movement_005: Depth Layer Parallax",
+)
+_MOTION_RULES = {
+    "pan": _COMPOSITION_FLOW_RULES,
+    "tilt": _COMPOSITION_FLOW_RULES,
+    "orbit": _COMPOSITION_FLOW_RULES,
+    "zoom": ("movement_008: Emotional Framing Progression",),
+    "dolly": ("movement_008: Emotional Framing Progression",),
+    # Static camera emphasizes subject movement
+    "static": (
+        "movement_001: Pose-to-Action Continuation",
+        "movement_004: Emotional Momentum Analysis",
+    ),
+}
+# Physics and environmental rules apply to every camera motion
+_ALWAYS_APPLIED_RULES = (
+    "movement_003: Physics-Based Environmental Motion",
+    "movement_006: Atmospheric Response System",
+)
+_CINEMATIC_RULES_BY_MOTION = {
+    motion_type: rules + _ALWAYS_APPLIED_RULES for motion_type, rules in _MOTION_RULES.items()
+}
+
+
+# Prompt elements and temporal keywords checked by analyze_prompt_quality
+ESSENTIAL_ELEMENTS = (
+    "subject", "action", "environment", "lighting", "atmosphere", "camera", "style"
+)
+ELEMENT_BITS = {element: 1 << i for i, element in enumerate(ESSENTIAL_ELEMENTS)}
+TEMPORAL_KEYWORDS = ("gradually", "slowly", "smoothly", "continuous", "steady")
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("catalog data is shared and read-only; copy it before modifying")
+
+
+class _FrozenDict(dict):
+    """Read-only dict for shared catalog data (still JSON-serializable)"""
+    
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __reduce__(self):
+        # Copies and pickles come back as plain, mutable dicts
+        return dict, (dict(self),)
+
+
+class _FrozenList(list):
+    """Read-only list for shared catalog data (still JSON-serializable)"""
+    
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON containers into read-only ones"""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _deep_freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_deep_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _load_catalog_cached(path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Parse a catalog file; ``mtime_ns`` is only part of the cache key"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        catalog = orjson.loads(data)
+    else:
+        # Only needed on this path, so keep it off the module import
+        import json
+        catalog = json.loads(data)
+    # Shared between analyzers at every level, so freeze the whole tree
+    return _deep_freeze(catalog)
+
+
+def _load_catalog(catalog_path: str) -> Mapping[str, Any]:
+    """Load a prompt catalog, parsing each file version only once per process"""
+    path = os.path.abspath(catalog_path)
+    return _load_catalog_cached(path, os.stat(path).st_mtime_ns)
 
 
 class VideoPromptAnalyzer:
     """Analyzer for AI video generation prompts"""
     
-    def __init__(self, catalog_path: str = "configs/video_prompting_catalog.json"):
-        """Initialize analyzer with prompt catalog"""
-        with open(catalog_path, 'r', encoding='utf-8') as f:
-            self.catalog = json.load(f)
+    def __init__(
+        self,
+        catalog_path: str = "configs/video_prompting_catalog.json",
+        models: Optional[Iterable[ModelType]] = None
+    ):
+        """Initialize analyzer with prompt catalog
+        
+        When ``models`` is given, only those models' catalog entries are
+        indexed; every other model behaves as if missing from the catalog.
+        """
+        self.catalog = _load_catalog(catalog_path)
         
         self.model_catalog = self.catalog["model_catalog"]
+        if models is not None:
+            keys = {mt.value for mt in models}
+            self.model_catalog = {
+                key: info for key, info in self.model_catalog.items() if key in keys
+            }
         self.best_practices = self.catalog["universal_best_practices"]
         self.parameter_glossary = self.catalog["parameter_glossary"]
+        
+        # Per-model lookups keyed on the enum member itself, so hot paths do
+        # a single dict lookup instead of resolving ``model_type.value`` first
+        self._model_info_by_enum: Dict[ModelType, Dict[str, Any]] = {
+            mt: self.model_catalog.get(key, {}) for mt, key in _MT_VALUE.items()
+        }
+        self._controllability_by_enum: Dict[ModelType, Dict[str, Any]] = {
+            mt: model_info.get("controllability_parameters", {})
+            for mt, model_info in self._model_info_by_enum.items()
+        }
+        self._best_practices_by_enum: Dict[ModelType, Dict[str, List[str]]] = {
+            mt: model_info.get("best_practices", {})
+            for mt, model_info in self._model_info_by_enum.items()
+        }
+        
+        # Temporal-critical parameter names per model, in catalog order, plus
+        # a frozenset of the same names for membership tests
+        self._critical_params: Dict[ModelType, Tuple[str, ...]] = {
+            mt: tuple(
+                param_name
+                for param_name, param_info in model_params.items()
+                if param_info.get("temporal_consistency_impact") in ("critical", "high")
+            )
+            for mt, model_params in self._controllability_by_enum.items()
+        }
+        self._critical_param_sets: Dict[ModelType, frozenset] = {
+            mt: frozenset(params) for mt, params in self._critical_params.items()
+        }
+        
+        # Allowed values of every enum parameter as a frozenset, built once.
+        # Kept beside the catalog because the parsed catalog is shared
+        self._enum_value_sets: Dict[ModelType, Dict[str, frozenset]] = {
+            mt: {
+                param_name: frozenset(param_spec.get("values", []))
+                for param_name, param_spec in model_params.items()
+                if param_spec.get("type") == "enum"
+            }
+            for mt, model_params in self._controllability_by_enum.items()
+        }
+    
+    @classmethod
+    def for_models(
+        cls,
+        models: Iterable[ModelType],
+        catalog_path: str = "configs/video_prompting_catalog.json"
+    ) -> VideoPromptAnalyzer:
+        """Create an analyzer that only indexes the given models"""
+        return cls(catalog_path, models=models)
     
     def get_model_info(self, model_type: ModelType) -> Dict[str, Any]:
         """Get information about a specific model"""
-        return self.model_catalog.get(model_type.value, {})
+        return self._model_info_by_enum[model_type]
     
     def get_controllability_parameters(self, model_type: ModelType) -> Dict[str, Any]:
         """Get controllability parameters for a model"""
-        model_info = self.get_model_info(model_type)
-        return model_info.get("controllability_parameters", {})
+        return self._controllability_by_enum[model_type]
     
     def get_temporal_critical_params(self, model_type: ModelType) -> List[str]:
         """Get parameters critical for temporal consistency"""
-        params = self.get_controllability_parameters(model_type)
-        critical = []
-        
-        for param_name, param_info in params.items():
-            if param_info.get("temporal_consistency_impact") in ["critical", "high"]:
-                critical.append(param_name)
-        
-        return critical
+        return list(self._critical_params[model_type])
     
     def get_best_practices_for_model(self, model_type: ModelType) -> Dict[str, List[str]]:
         """Get best practices for a specific model"""
-        model_info = self.get_model_info(model_type)
-        return model_info.get("best_practices", {})
+        return self._best_practices_by_enum[model_type]
     
     def validate_parameters(self, model_type: ModelType, parameters: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate parameters against model specifications"""
-        model_params = self.get_controllability_parameters(model_type)
+        model_params = self._controllability_by_enum[model_type]
+        enum_value_sets = self._enum_value_sets[model_type]
         errors = []
         warnings = []
         
         for param_name, param_value in parameters.items():
             if param_name not in model_params:
-                warnings.append(f"Parameter '{param_name}' not recognized for {model_type.value}")
+                warnings.append(f"Parameter '{param_name}' not recognized for {_MT_VALUE[model_type]}")
                 continue
             
             param_spec = model_params[param_name]
@@ -180,7 +381,12 @@ class VideoPromptAnalyzer:
             # Type validation
             if param_type == "enum":
                 allowed_values = param_spec.get("values", [])
-                if param_value not in allowed_values:
+                try:
+                    allowed = param_value in enum_value_sets[param_name]
+                except TypeError:
+                    # Unhashable value: fall back to the catalog list
+                    allowed = param_value in allowed_values
+                if not allowed:
                     errors.append(f"Parameter '{param_name}' must be one of {allowed_values}, got '{param_value}'")
             
             elif param_type == "range":
@@ -198,35 +404,45 @@ class VideoPromptAnalyzer:
     def optimize_for_temporal_consistency(
         self,
         model_type: ModelType,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        copy: bool = True
     ) -> Dict[str, Any]:
-        """Optimize parameters for temporal consistency"""
-        optimized = parameters.copy()
-        critical_params = self.get_temporal_critical_params(model_type)
+        """Optimize parameters for temporal consistency
+        
+        Recommended values are collected into a small overrides dict first.
+        ``parameters`` is left untouched unless the caller already owns it and
+        passes ``copy=False``, in which case only the overridden keys are
+        written back instead of copying the whole dict.
+        """
+        critical_params = self._critical_param_sets[model_type]
+        overrides = {}
         
         # Apply recommended values for temporal consistency
-        if "seed" in critical_params and "seed" not in optimized:
-            optimized["seed"] = 42  # Use fixed seed for reproducibility
+        if "seed" in critical_params and "seed" not in parameters:
+            overrides["seed"] = 42  # Use fixed seed for reproducibility
         
         if "temporal_consistency" in critical_params:
-            if optimized.get("temporal_consistency", 0) < 0.7:
-                optimized["temporal_consistency"] = 0.8
+            if parameters.get("temporal_consistency", 0) < 0.7:
+                overrides["temporal_consistency"] = 0.8
         
         if "temporal_weight" in critical_params:
-            if optimized.get("temporal_weight", 0) < 0.7:
-                optimized["temporal_weight"] = 0.8
+            if parameters.get("temporal_weight", 0) < 0.7:
+                overrides["temporal_weight"] = 0.8
         
         if "motion_strength" in critical_params:
             # Moderate motion strength for stability
-            if optimized.get("motion_strength", 1.0) > 0.7:
-                optimized["motion_strength"] = 0.6
+            if parameters.get("motion_strength", 1.0) > 0.7:
+                overrides["motion_strength"] = 0.6
         
         if "guidance_scale" in critical_params:
             # Balanced guidance for consistency
-            if "guidance_scale" not in optimized:
-                optimized["guidance_scale"] = 7.5
+            if "guidance_scale" not in parameters:
+                overrides["guidance_scale"] = 7.5
         
-        return optimized
+        if not copy:
+            parameters.update(overrides)
+            return parameters
+        return {**parameters, **overrides}
     
     def generate_multi_scene_plan(
         self,
@@ -238,21 +454,34 @@ class VideoPromptAnalyzer:
         if transitions is None:
             transitions = [SceneTransition(type="fade") for _ in range(len(scenes) - 1)]
         
-        # Analyze consistency requirements
-        character_descriptions = [scene.subject for scene in scenes]
-        environment_descriptions = [scene.environment for scene in scenes]
-        lighting_descriptions = [scene.lighting for scene in scenes]
-        styles = [scene.style for scene in scenes]
+        # Analyze consistency requirements, assign per-scene seeds and build
+        # prompts in a single pass over the scenes
+        characters, environments, lightings, styles = set(), set(), set(), set()
+        scene_prompts = []
+        base_seed = scenes[0].temporal_config.seed or 42
+        for i, scene in enumerate(scenes):
+            # Each set only needs to grow one past its check's limit, so
+            # stop adding once the outcome is decided
+            if len(characters) < 2:
+                characters.add(scene.subject)
+            if len(environments) < 3:
+                environments.add(scene.environment)
+            if len(lightings) < 3:
+                lightings.add(scene.lighting)
+            if len(styles) < 2:
+                styles.add(scene.style)
+            scene.temporal_config = replace(scene.temporal_config, seed=base_seed + i)
+            scene_prompts.append(scene.to_prompt(model_type))
         
         # Check for consistency
         consistency_report = {
             "total_scenes": len(scenes),
             "transitions": [t.type for t in transitions],
             "consistency_checks": {
-                "character_consistency": len(set(character_descriptions)) == 1,
-                "environment_continuity": len(set(environment_descriptions)) <= 2,
-                "lighting_coherence": len(set(lighting_descriptions)) <= 2,
-                "style_uniformity": len(set(styles)) == 1
+                "character_consistency": len(characters) == 1,
+                "environment_continuity": len(environments) <= 2,
+                "lighting_coherence": len(lightings) <= 2,
+                "style_uniformity": len(styles) == 1
             },
             "recommendations": []
         }
@@ -268,14 +497,7 @@ class VideoPromptAnalyzer:
                 "Visual style varies across scenes. Maintain consistent style descriptors for better coherence."
             )
         
-        # Generate temporal consistency config for all scenes
-        base_seed = scenes[0].temporal_config.seed or 42
-        for i, scene in enumerate(scenes):
-            scene.temporal_config.seed = base_seed + i
-        
-        consistency_report["scene_prompts"] = [
-            scene.to_prompt(model_type) for scene in scenes
-        ]
+        consistency_report["scene_prompts"] = scene_prompts
         
         return consistency_report
     
@@ -285,64 +507,40 @@ class VideoPromptAnalyzer:
         movement_rules: Dict[str, Any]
     ) -> List[str]:
         """Map camera motion to ANIMAtiZE cinematic rules"""
-        applicable_rules = []
-        
-        # Map camera motion to movement prediction rules
-        if camera_motion.type in ["pan", "tilt", "orbit"]:
-            applicable_rules.append("movement_002: Composition-Guided Camera Flow")
-            applicable_rules.append("movement_005: Depth Layer Parallax")
-        
-        if camera_motion.type in ["zoom", "dolly"]:
-            applicable_rules.append("movement_008: Emotional Framing Progression")
-        
-        if camera_motion.type == "static":
-            # Static camera emphasizes subject movement
-            applicable_rules.append("movement_001: Pose-to-Action Continuation")
-            applicable_rules.append("movement_004: Emotional Momentum Analysis")
-        
-        # Always apply physics and environmental rules
-        applicable_rules.append("movement_003: Physics-Based Environmental Motion")
-        applicable_rules.append("movement_006: Atmospheric Response System")
-        
-        return applicable_rules
+        return list(_CINEMATIC_RULES_BY_MOTION.get(camera_motion.type, _ALWAYS_APPLIED_RULES))
     
     def analyze_prompt_quality(self, prompt: str, model_type: ModelType) -> Dict[str, Any]:
         """Analyze prompt quality and provide suggestions"""
         quality_report = {
             "prompt": prompt,
-            "model": model_type.value,
+            "model": _MT_VALUE[model_type],
             "completeness": {},
             "suggestions": [],
             "score": 0.0
         }
         
-        # Check for essential elements
-        essential_elements = [
-            "subject", "action", "environment", "lighting", "atmosphere", "camera", "style"
-        ]
-        
+        # Check for essential elements. Simple keyword detection: the plural
+        # and -ing forms contain the base word, so one substring test each
+        # covers all three variants. Found elements are OR-ed into a bitmask
+        # and suggestions for missing ones are emitted in the same pass
         prompt_lower = prompt.lower()
-        for element in essential_elements:
-            # Simple keyword detection
-            quality_report["completeness"][element] = any(
-                keyword in prompt_lower 
-                for keyword in [element, element + "s", element + "ing"]
-            )
-        
-        # Calculate completeness score
-        present_count = sum(quality_report["completeness"].values())
-        quality_report["score"] = (present_count / len(essential_elements)) * 100
-        
-        # Generate suggestions
-        for element, present in quality_report["completeness"].items():
-            if not present:
-                quality_report["suggestions"].append(
-                    f"Consider adding {element} description for better results"
-                )
+        completeness = quality_report["completeness"]
+        suggestions = quality_report["suggestions"]
+        mask = 0
+        for element, bit in ELEMENT_BITS.items():
+            present = element in prompt_lower
+            completeness[element] = present
+            if present:
+                mask |= bit
+            else:
+                suggestions.append(f"Consider adding {element} description for better results")
+        
+        # Calculate completeness score from the popcount of the mask
+        present_count = bin(mask).count("1")
+        quality_report["score"] = (present_count / len(ELEMENT_BITS)) * 100
         
         # Check for temporal consistency keywords
-        temporal_keywords = ["gradually", "slowly", "smoothly", "continuous", "steady"]
-        has_temporal_guidance = any(kw in prompt_lower for kw in temporal_keywords)
+        has_temporal_guidance = any(kw in prompt_lower for kw in TEMPORAL_KEYWORDS)
         
         if not has_temporal_guidance:
             quality_report["suggestions"].append(
@@ -380,36 +578,3 @@ def create_example_scene(model_type: ModelType) -> PromptStructure:
         temporal_config=temporal_config
     )
 
-
-if __name__ == "__main__":
-    # Example usage
-    analyzer = VideoPromptAnalyzer()
-    
-    # Analyze Kling model
-    kling_info = analyzer.get_model_info(ModelType.KLING)
-    print(f"Kling Model Info:")
-    print(f"  Max Duration: {kling_info['max_duration']}")
-    print(f"  Resolution: {kling_info['max_resolution']}")
-    print(f"  Modes: {kling_info['supported_modes']}")
-    
-    # Get temporal critical parameters
-    critical_params = analyzer.get_temporal_critical_params(ModelType.KLING)
-    print(f"\nTemporal Critical Parameters: {critical_params}")
-    
-    # Create and analyze example scene
-    scene = create_example_scene(ModelType.KLING)
-    prompt = scene.to_prompt(ModelType.KLING)
-    print(f"\nGenerated Prompt:\n{prompt}")
-    
-    # Analyze prompt quality
-    quality = analyzer.analyze_prompt_quality(prompt, ModelType.KLING)
-    print(f"\nPrompt Quality Score: {quality['score']:.1f}%")
-    print(f"Suggestions: {quality['suggestions']}")
-    
-    # Multi-scene planning
-    scenes = [create_example_scene(ModelType.KLING) for _ in range(3)]
-    plan = analyzer.generate_multi_scene_plan(scenes, ModelType.KLING)
-    print(f"\nMulti-Scene Consistency Report:")
-    print(f"  Total Scenes: {plan['total_scenes']}")
-    print(f"  Character Consistency: {plan['consistency_checks']['character_consistency']}")
-    print(f"  Style Uniformity: {plan['consistency_checks']['style_uniformity']}")
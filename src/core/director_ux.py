@@ -9,13 +9,58 @@ Provides professional-grade control interface for video generation with:
 - Validation for all control parameters
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Any
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 import json
+import sys
+import time
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    """Naive UTC ISO timestamp for a whole second, cached for the current second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    """Format epoch nanoseconds as a naive UTC ISO string with microseconds"""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return "%s.%06d" % (_iso_second(seconds), nanos // 1000)
+
+
+def _iso_to_ns(value: str) -> int:
+    """Parse an ISO timestamp (naive values are UTC) into epoch nanoseconds"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    delta = parsed - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+def _now_iso() -> str:
+    """Current UTC time as a naive ISO string with microseconds
+
+    Same format as ``datetime.utcnow().isoformat()``, but only the
+    sub-second part is formatted per call.
+    """
+    return _ns_to_iso(time.time_ns())
+
 
 class DirectorMode(str, Enum):
     """Operating modes for director interface"""
@@ -115,14 +160,62 @@ class StylePreset(str, Enum):
     EXPERIMENTAL = "experimental"
 
 
+def _by_value(enum_cls) -> Dict[str, Enum]:
+    """Map each member's value to the member"""
+    return {member.value: member for member in enum_cls}
+
+
+# Plain dict lookups for deserialization instead of calling the Enum class
+_MODE_BY_VALUE = _by_value(DirectorMode)
+_SHOT_TYPE_BY_VALUE = _by_value(ShotType)
+_ANGLE_BY_VALUE = _by_value(CameraAngle)
+_MOVEMENT_BY_VALUE = _by_value(CameraMovementType)
+_TRANSITION_BY_VALUE = _by_value(TransitionStyle)
+_STRENGTH_BY_VALUE = _by_value(MotionStrengthLevel)
+_PRESET_BY_VALUE = _by_value(StylePreset)
+
+
+def _enum_from_value(table: Dict[str, Enum], enum_cls, value: Any) -> Enum:
+    """Resolve an enum member through ``table``, raising like ``enum_cls(value)``"""
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
 class ValidationError(Exception):
     """Raised when control parameter validation fails"""
 
     pass
 
 
-@dataclass
-class CameraControl:
+# Allowed values for validation membership checks
+_VALID_EASINGS = frozenset({"linear", "ease_in", "ease_out", "ease_in_out"})
+_VALID_FPS = frozenset({12, 24, 25, 30, 48, 60, 120})
+_VALID_RATIOS = frozenset({"16:9", "4:3", "21:9", "1:1", "9:16"})
+
+
+class _CachedParamsMixin:
+    """Memoizes internal params until a field value changes
+
+    Subclasses set ``_param_values`` to an attrgetter over their fields,
+    declare ``_params_key``/``_params_cache`` fields and implement
+    ``_build_internal_params``. The cached dict is shared, so public
+    accessors hand out copies.
+    """
+
+    __slots__ = ()
+
+    def _cached_internal_params(self) -> Dict[str, Any]:
+        key = self._param_values(self)
+        if key != self._params_key:
+            self._params_cache = self._build_internal_params()
+            self._params_key = key
+        return self._params_cache
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class CameraControl(_CachedParamsMixin):
     """Professional camera control parameters"""
 
     movement_type: CameraMovementType = CameraMovementType.STATIC
@@ -134,6 +227,13 @@ class CameraControl:
     easing: str = "linear"  # linear, ease_in, ease_out, ease_in_out
     start_time: float = 0.0
     end_time: Optional[float] = None
+    _params_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _params_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    _param_values = attrgetter(
+        "movement_type", "angle", "shot_type", "focal_length", "speed",
+        "strength", "easing", "start_time", "end_time",
+    )
 
     def validate(self) -> List[str]:
         """Validate camera control parameters"""
@@ -145,7 +245,7 @@ class CameraControl:
         if self.speed < 0.1 or self.speed > 5.0:
             errors.append(f"Speed {self.speed} out of range (0.1-5.0)")
 
-        if self.easing not in ["linear", "ease_in", "ease_out", "ease_in_out"]:
+        if self.easing not in _VALID_EASINGS:
             errors.append(f"Invalid easing function: {self.easing}")
 
         if self.start_time < 0:
@@ -158,6 +258,10 @@ class CameraControl:
 
     def to_internal_params(self) -> Dict[str, Any]:
         """Convert to internal parameter format"""
+        params = self._cached_internal_params()
+        return {**params, "camera_motion": dict(params["camera_motion"])}
+
+    def _build_internal_params(self) -> Dict[str, Any]:
         return {
             "camera_motion": {
                 "type": self.movement_type.value,
@@ -172,8 +276,22 @@ class CameraControl:
             "focal_length": self.focal_length,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "movement_type": self.movement_type.value,
+            "angle": self.angle.value,
+            "shot_type": self.shot_type.value,
+            "focal_length": self.focal_length,
+            "speed": self.speed,
+            "strength": self.strength.value,
+            "easing": self.easing,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TransitionControl:
     """Transition control parameters"""
 
@@ -203,8 +321,17 @@ class TransitionControl:
             **self.parameters,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "style": self.style.value,
+            "duration": self.duration,
+            "offset": self.offset,
+            "parameters": dict(self.parameters),
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TimingControl:
     """Timing and tempo control"""
 
@@ -220,7 +347,7 @@ class TimingControl:
         if self.duration < 1.0 or self.duration > 60.0:
             errors.append(f"Duration {self.duration}s out of range (1-60s)")
 
-        if self.fps not in [12, 24, 25, 30, 48, 60, 120]:
+        if self.fps not in _VALID_FPS:
             errors.append(f"FPS {self.fps} not a standard value (12, 24, 25, 30, 48, 60, 120)")
 
         if self.speed_factor < 0.25 or self.speed_factor > 4.0:
@@ -240,9 +367,13 @@ class TimingControl:
             "start_offset": self.start_offset,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return self.to_internal_params()
+
 
-@dataclass
-class MotionControl:
+@dataclass(**_DATACLASS_SLOTS)
+class MotionControl(_CachedParamsMixin):
     """Subject and scene motion control"""
 
     overall_strength: MotionStrengthLevel = MotionStrengthLevel.MODERATE
@@ -251,6 +382,13 @@ class MotionControl:
     background_motion: float = 0.3  # 0.0-1.0
     motion_blur: bool = True
     motion_blur_amount: float = 0.5  # 0.0-1.0
+    _params_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _params_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    _param_values = attrgetter(
+        "overall_strength", "subject_motion", "camera_motion",
+        "background_motion", "motion_blur", "motion_blur_amount",
+    )
 
     def validate(self) -> List[str]:
         """Validate motion control parameters"""
@@ -272,6 +410,9 @@ class MotionControl:
 
     def to_internal_params(self) -> Dict[str, Any]:
         """Convert to internal parameter format"""
+        return dict(self._cached_internal_params())
+
+    def _build_internal_params(self) -> Dict[str, Any]:
         return {
             "motion_strength": self.overall_strength.value,
             "subject_motion": self.subject_motion,
@@ -281,18 +422,48 @@ class MotionControl:
             "motion_blur_amount": self.motion_blur_amount,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "overall_strength": self.overall_strength.value,
+            "subject_motion": self.subject_motion,
+            "camera_motion": self.camera_motion,
+            "background_motion": self.background_motion,
+            "motion_blur": self.motion_blur,
+            "motion_blur_amount": self.motion_blur_amount,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParameterLock:
     """Lock status for iteration workflow"""
 
     locked: bool = False
-    locked_at: Optional[str] = None
+    locked_at: Optional[int] = None  # epoch nanoseconds
     locked_value: Optional[Any] = None
     notes: str = ""
 
+    def __post_init__(self):
+        # Accept ISO strings from serialized data
+        if isinstance(self.locked_at, str):
+            self.locked_at = _iso_to_ns(self.locked_at)
+
+    @property
+    def locked_at_iso(self) -> Optional[str]:
+        """Lock time as an ISO string"""
+        return _ns_to_iso(self.locked_at) if self.locked_at is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "locked": self.locked,
+            "locked_at": self.locked_at_iso,
+            "locked_value": self.locked_value,
+            "notes": self.notes,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GenerationComparison:
     """Comparison data for iteration workflow"""
 
@@ -302,10 +473,32 @@ class GenerationComparison:
     thumbnail_url: Optional[str] = None
     rating: Optional[int] = None  # 1-5
     notes: str = ""
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: int = field(default_factory=time.time_ns)  # epoch nanoseconds
+
+    def __post_init__(self):
+        # Accept ISO strings from serialized data
+        if isinstance(self.created_at, str):
+            self.created_at = _iso_to_ns(self.created_at)
+
+    @property
+    def created_at_iso(self) -> str:
+        """Creation time as an ISO string"""
+        return _ns_to_iso(self.created_at)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "generation_id": self.generation_id,
+            "parameters": dict(self.parameters),
+            "result_url": self.result_url,
+            "thumbnail_url": self.thumbnail_url,
+            "rating": self.rating,
+            "notes": self.notes,
+            "created_at": self.created_at_iso,
+        }
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class DirectorControls:
     """Complete director control surface"""
 
@@ -337,14 +530,18 @@ class DirectorControls:
     generation_history: List[GenerationComparison] = field(default_factory=list)
 
     # Metadata
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    modified_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    modified_at: str = field(default_factory=_now_iso)
     version: str = "1.0"
 
-    def validate(self) -> Dict[str, Any]:
+    def validate(self, fail_fast: bool = False) -> Dict[str, Any]:
         """
         Validate all control parameters
 
+        Args:
+            fail_fast: Stop at the first stage that reports errors instead
+                of collecting errors and warnings from every stage
+
         Returns:
             Dictionary with validation results
         """
@@ -355,18 +552,24 @@ class DirectorControls:
         if camera_errors:
             results["errors"].extend([f"Camera: {e}" for e in camera_errors])
             results["valid"] = False
+            if fail_fast:
+                return results
 
         # Validate timing controls
         timing_errors = self.timing.validate()
         if timing_errors:
             results["errors"].extend([f"Timing: {e}" for e in timing_errors])
             results["valid"] = False
+            if fail_fast:
+                return results
 
         # Validate motion controls
         motion_errors = self.motion.validate()
         if motion_errors:
             results["errors"].extend([f"Motion: {e}" for e in motion_errors])
             results["valid"] = False
+            if fail_fast:
+                return results
 
         # Validate transition controls
         if self.transition:
@@ -374,15 +577,18 @@ class DirectorControls:
             if transition_errors:
                 results["errors"].extend([f"Transition: {e}" for e in transition_errors])
                 results["valid"] = False
+                if fail_fast:
+                    return results
 
         # Validate depth of field
         if self.depth_of_field < 0.0 or self.depth_of_field > 1.0:
             results["errors"].append(f"Depth of field {self.depth_of_field} out of range (0.0-1.0)")
             results["valid"] = False
+            if fail_fast:
+                return results
 
         # Validate aspect ratio
-        valid_ratios = ["16:9", "4:3", "21:9", "1:1", "9:16"]
-        if self.aspect_ratio not in valid_ratios:
+        if self.aspect_ratio not in _VALID_RATIOS:
             results["warnings"].append(f"Unusual aspect ratio: {self.aspect_ratio}")
 
         # Pro mode validation
@@ -392,61 +598,63 @@ class DirectorControls:
 
         return results
 
+    def is_valid(self) -> bool:
+        """Check validity only, returning at the first failing stage"""
+        if self.camera.validate() or self.timing.validate() or self.motion.validate():
+            return False
+        if self.transition and self.transition.validate():
+            return False
+        return not (self.depth_of_field < 0.0 or self.depth_of_field > 1.0)
+
     def lock_parameter(self, parameter_name: str, value: Any, notes: str = ""):
         """Lock a parameter for iteration refinement"""
+        now_ns = time.time_ns()
         self.locked_parameters[parameter_name] = ParameterLock(
-            locked=True, locked_at=datetime.utcnow().isoformat(), locked_value=value, notes=notes
+            locked=True, locked_at=now_ns, locked_value=value, notes=notes
         )
-        self.modified_at = datetime.utcnow().isoformat()
+        self.modified_at = _ns_to_iso(now_ns)
 
     def unlock_parameter(self, parameter_name: str):
         """Unlock a parameter"""
         if parameter_name in self.locked_parameters:
             self.locked_parameters[parameter_name].locked = False
-            self.modified_at = datetime.utcnow().isoformat()
+            self.modified_at = _now_iso()
 
     def add_comparison(self, comparison: GenerationComparison):
         """Add generation to comparison history"""
         self.generation_history.append(comparison)
-        self.modified_at = datetime.utcnow().isoformat()
+        self.modified_at = _now_iso()
 
     def get_best_generation(self) -> Optional[GenerationComparison]:
         """Get highest rated generation"""
-        rated = [g for g in self.generation_history if g.rating is not None]
-        if not rated:
-            return None
-        return max(rated, key=lambda x: x.rating)
+        return max(
+            (g for g in self.generation_history if g.rating is not None),
+            key=attrgetter("rating"),
+            default=None,
+        )
 
     def to_internal_params(self) -> Dict[str, Any]:
         """Convert all controls to internal parameter format"""
-        params = {}
-
-        # Camera parameters
-        params.update(self.camera.to_internal_params())
-
-        # Timing parameters
-        params.update(self.timing.to_internal_params())
-
-        # Motion parameters
-        params.update(self.motion.to_internal_params())
+        # Built in one literal from the cached camera/motion params. The motion
+        # "camera_motion" amount overrides the camera's nested movement dict,
+        # so no cached nested object is handed out.
+        params = {
+            **self.camera._cached_internal_params(),
+            **self.timing.to_internal_params(),
+            **self.motion._cached_internal_params(),
+            "visual_style": self.visual_style,
+            "mood": self.mood,
+            "color_grade": self.color_grade,
+            "depth_of_field": self.depth_of_field,
+            "lighting_style": self.lighting_style,
+            "composition_rule": self.composition_rule,
+            "aspect_ratio": self.aspect_ratio,
+        }
 
         # Transition parameters
         if self.transition:
             params["transition"] = self.transition.to_internal_params()
 
-        # Style parameters
-        params.update(
-            {
-                "visual_style": self.visual_style,
-                "mood": self.mood,
-                "color_grade": self.color_grade,
-                "depth_of_field": self.depth_of_field,
-                "lighting_style": self.lighting_style,
-                "composition_rule": self.composition_rule,
-                "aspect_ratio": self.aspect_ratio,
-            }
-        )
-
         # Apply locked parameters
         for param_name, lock in self.locked_parameters.items():
             if lock.locked and lock.locked_value is not None:
@@ -455,20 +663,83 @@ class DirectorControls:
         return params
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
-        return asdict(self)
+        """Convert to dictionary for serialization
+
+        Built field by field rather than with ``dataclasses.asdict``, which
+        reflects over and deep-copies every nested value. Enums are stored
+        by value and containers are shallow-copied.
+        """
+        return {
+            "control_id": self.control_id,
+            "mode": self.mode.value,
+            "camera": self.camera.to_dict(),
+            "timing": self.timing.to_dict(),
+            "motion": self.motion.to_dict(),
+            "transition": self.transition.to_dict() if self.transition else None,
+            "style_preset": self.style_preset.value if self.style_preset else None,
+            "visual_style": self.visual_style,
+            "mood": self.mood,
+            "color_grade": self.color_grade,
+            "depth_of_field": self.depth_of_field,
+            "lighting_style": self.lighting_style,
+            "composition_rule": self.composition_rule,
+            "aspect_ratio": self.aspect_ratio,
+            "locked_parameters": {name: lock.to_dict() for name, lock in self.locked_parameters.items()},
+            "generation_history": [comparison.to_dict() for comparison in self.generation_history],
+            "created_at": self.created_at,
+            "modified_at": self.modified_at,
+            "version": self.version,
+        }
+
+    def clone(self) -> "DirectorControls":
+        """Copy these controls under a new control ID
+
+        Nested controls, locks and history entries are copied one level deep,
+        matching a ``from_dict(to_dict())`` round trip without building the
+        intermediate dicts.
+        """
+        return DirectorControls(
+            control_id=str(uuid.uuid4()),
+            mode=self.mode,
+            camera=replace(self.camera),
+            timing=replace(self.timing),
+            motion=replace(self.motion),
+            transition=(
+                replace(self.transition, parameters=dict(self.transition.parameters)) if self.transition else None
+            ),
+            style_preset=self.style_preset,
+            visual_style=self.visual_style,
+            mood=self.mood,
+            color_grade=self.color_grade,
+            depth_of_field=self.depth_of_field,
+            lighting_style=self.lighting_style,
+            composition_rule=self.composition_rule,
+            aspect_ratio=self.aspect_ratio,
+            locked_parameters={name: replace(lock) for name, lock in self.locked_parameters.items()},
+            generation_history=[
+                replace(comparison, parameters=dict(comparison.parameters))
+                for comparison in self.generation_history
+            ],
+            created_at=self.created_at,
+            modified_at=self.modified_at,
+            version=self.version,
+        )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DirectorControls":
         """Create from dictionary"""
         camera_data = data.get("camera", {})
         camera = CameraControl(
-            movement_type=CameraMovementType(camera_data.get("movement_type", "static")),
-            angle=CameraAngle(camera_data.get("angle", "eye_level")),
-            shot_type=ShotType(camera_data.get("shot_type", "medium")),
+            movement_type=_enum_from_value(
+                _MOVEMENT_BY_VALUE, CameraMovementType, camera_data.get("movement_type", "static")
+            ),
+            angle=_enum_from_value(_ANGLE_BY_VALUE, CameraAngle, camera_data.get("angle", "eye_level")),
+            shot_type=_enum_from_value(_SHOT_TYPE_BY_VALUE, ShotType, camera_data.get("shot_type", "medium")),
             focal_length=camera_data.get("focal_length", 50),
             speed=camera_data.get("speed", 1.0),
-            strength=MotionStrengthLevel(camera_data.get("strength", "moderate")),
+            strength=_enum_from_value(
+                _STRENGTH_BY_VALUE, MotionStrengthLevel, camera_data.get("strength", "moderate")
+            ),
             easing=camera_data.get("easing", "linear"),
             start_time=camera_data.get("start_time", 0.0),
             end_time=camera_data.get("end_time"),
@@ -484,7 +755,9 @@ class DirectorControls:
 
         motion_data = data.get("motion", {})
         motion = MotionControl(
-            overall_strength=MotionStrengthLevel(motion_data.get("overall_strength", "moderate")),
+            overall_strength=_enum_from_value(
+                _STRENGTH_BY_VALUE, MotionStrengthLevel, motion_data.get("overall_strength", "moderate")
+            ),
             subject_motion=motion_data.get("subject_motion", 0.5),
             camera_motion=motion_data.get("camera_motion", 0.5),
             background_motion=motion_data.get("background_motion", 0.3),
@@ -496,20 +769,27 @@ class DirectorControls:
         if "transition" in data and data["transition"]:
             trans_data = data["transition"]
             transition = TransitionControl(
-                style=TransitionStyle(trans_data.get("style", "cut")),
+                style=_enum_from_value(_TRANSITION_BY_VALUE, TransitionStyle, trans_data.get("style", "cut")),
                 duration=trans_data.get("duration", 1.0),
                 offset=trans_data.get("offset", 0.0),
                 parameters=trans_data.get("parameters", {}),
             )
 
+        # Only stamp the current time when the payload lacks a timestamp
+        now = _now_iso() if "created_at" not in data or "modified_at" not in data else None
+
         return cls(
-            control_id=data.get("control_id", str(uuid.uuid4())),
-            mode=DirectorMode(data.get("mode", "auto")),
+            control_id=data["control_id"] if "control_id" in data else str(uuid.uuid4()),
+            mode=_enum_from_value(_MODE_BY_VALUE, DirectorMode, data.get("mode", "auto")),
             camera=camera,
             timing=timing,
             motion=motion,
             transition=transition,
-            style_preset=StylePreset(data["style_preset"]) if "style_preset" in data and data["style_preset"] else None,
+            style_preset=(
+                _enum_from_value(_PRESET_BY_VALUE, StylePreset, data["style_preset"])
+                if "style_preset" in data and data["style_preset"]
+                else None
+            ),
             visual_style=data.get("visual_style", "cinematic"),
             mood=data.get("mood", "neutral"),
             color_grade=data.get("color_grade", "natural"),
@@ -517,185 +797,222 @@ class DirectorControls:
             lighting_style=data.get("lighting_style", "natural"),
             composition_rule=data.get("composition_rule", "rule_of_thirds"),
             aspect_ratio=data.get("aspect_ratio", "16:9"),
-            locked_parameters=data.get("locked_parameters", {}),
-            generation_history=data.get("generation_history", []),
-            created_at=data.get("created_at", datetime.utcnow().isoformat()),
-            modified_at=data.get("modified_at", datetime.utcnow().isoformat()),
+            locked_parameters={
+                name: ParameterLock(**lock) if isinstance(lock, dict) else lock
+                for name, lock in data.get("locked_parameters", {}).items()
+            },
+            generation_history=[
+                GenerationComparison(**comparison) if isinstance(comparison, dict) else comparison
+                for comparison in data.get("generation_history", [])
+            ],
+            created_at=data.get("created_at", now),
+            modified_at=data.get("modified_at", now),
             version=data.get("version", "1.0"),
         )
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string (via orjson when available)"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict()).decode("utf-8")
+        return json.dumps(self.to_dict())
 
-class PresetLibrary:
-    """Library of professional style presets"""
+    @classmethod
+    def from_json(cls, data: str) -> "DirectorControls":
+        """Create from a JSON string or bytes"""
+        return cls.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+
+
+def _make_documentary() -> DirectorControls:
+    """Build the documentary style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.HANDHELD,
+            angle=CameraAngle.EYE_LEVEL,
+            shot_type=ShotType.MEDIUM,
+            focal_length=35,
+            speed=0.8,
+            strength=MotionStrengthLevel.SUBTLE,
+        ),
+        timing=TimingControl(duration=8.0, fps=24),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.4, camera_motion=0.6
+        ),
+        transition=TransitionControl(style=TransitionStyle.CUT),
+        style_preset=StylePreset.DOCUMENTARY,
+        visual_style="naturalistic",
+        mood="observational",
+        color_grade="neutral",
+        depth_of_field=0.7,
+        lighting_style="natural",
+        composition_rule="rule_of_thirds",
+    )
 
-    @staticmethod
-    def get_preset(preset_type: StylePreset) -> DirectorControls:
-        """Get a predefined style preset"""
 
-        if preset_type == StylePreset.DOCUMENTARY:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.HANDHELD,
-                    angle=CameraAngle.EYE_LEVEL,
-                    shot_type=ShotType.MEDIUM,
-                    focal_length=35,
-                    speed=0.8,
-                    strength=MotionStrengthLevel.SUBTLE,
-                ),
-                timing=TimingControl(duration=8.0, fps=24),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.4, camera_motion=0.6
-                ),
-                transition=TransitionControl(style=TransitionStyle.CUT),
-                style_preset=StylePreset.DOCUMENTARY,
-                visual_style="naturalistic",
-                mood="observational",
-                color_grade="neutral",
-                depth_of_field=0.7,
-                lighting_style="natural",
-                composition_rule="rule_of_thirds",
-            )
+def _make_commercial() -> DirectorControls:
+    """Build the commercial style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.DOLLY,
+            angle=CameraAngle.EYE_LEVEL,
+            shot_type=ShotType.MEDIUM,
+            focal_length=50,
+            speed=0.6,
+            strength=MotionStrengthLevel.MODERATE,
+            easing="ease_in_out",
+        ),
+        timing=TimingControl(duration=5.0, fps=30),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.MODERATE,
+            subject_motion=0.5,
+            camera_motion=0.7,
+            motion_blur=True,
+        ),
+        transition=TransitionControl(style=TransitionStyle.DISSOLVE, duration=0.8),
+        style_preset=StylePreset.COMMERCIAL,
+        visual_style="polished",
+        mood="aspirational",
+        color_grade="vibrant",
+        depth_of_field=0.4,
+        lighting_style="three_point",
+        composition_rule="golden_ratio",
+    )
 
-        elif preset_type == StylePreset.COMMERCIAL:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.DOLLY,
-                    angle=CameraAngle.EYE_LEVEL,
-                    shot_type=ShotType.MEDIUM,
-                    focal_length=50,
-                    speed=0.6,
-                    strength=MotionStrengthLevel.MODERATE,
-                    easing="ease_in_out",
-                ),
-                timing=TimingControl(duration=5.0, fps=30),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.MODERATE,
-                    subject_motion=0.5,
-                    camera_motion=0.7,
-                    motion_blur=True,
-                ),
-                transition=TransitionControl(style=TransitionStyle.DISSOLVE, duration=0.8),
-                style_preset=StylePreset.COMMERCIAL,
-                visual_style="polished",
-                mood="aspirational",
-                color_grade="vibrant",
-                depth_of_field=0.4,
-                lighting_style="three_point",
-                composition_rule="golden_ratio",
-            )
 
-        elif preset_type == StylePreset.ART_HOUSE:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.TRACKING_SHOT,
-                    angle=CameraAngle.LOW_ANGLE,
-                    shot_type=ShotType.WIDE,
-                    focal_length=24,
-                    speed=0.4,
-                    strength=MotionStrengthLevel.SUBTLE,
-                    easing="linear",
-                ),
-                timing=TimingControl(duration=12.0, fps=24, speed_factor=0.8),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.3, camera_motion=0.4
-                ),
-                transition=TransitionControl(style=TransitionStyle.FADE, duration=2.0),
-                style_preset=StylePreset.ART_HOUSE,
-                visual_style="atmospheric",
-                mood="contemplative",
-                color_grade="desaturated",
-                depth_of_field=0.6,
-                lighting_style="chiaroscuro",
-                composition_rule="symmetry",
-            )
+def _make_art_house() -> DirectorControls:
+    """Build the art house style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.TRACKING_SHOT,
+            angle=CameraAngle.LOW_ANGLE,
+            shot_type=ShotType.WIDE,
+            focal_length=24,
+            speed=0.4,
+            strength=MotionStrengthLevel.SUBTLE,
+            easing="linear",
+        ),
+        timing=TimingControl(duration=12.0, fps=24, speed_factor=0.8),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.3, camera_motion=0.4
+        ),
+        transition=TransitionControl(style=TransitionStyle.FADE, duration=2.0),
+        style_preset=StylePreset.ART_HOUSE,
+        visual_style="atmospheric",
+        mood="contemplative",
+        color_grade="desaturated",
+        depth_of_field=0.6,
+        lighting_style="chiaroscuro",
+        composition_rule="symmetry",
+    )
 
-        elif preset_type == StylePreset.ACTION:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.HANDHELD,
-                    angle=CameraAngle.EYE_LEVEL,
-                    shot_type=ShotType.MEDIUM,
-                    focal_length=35,
-                    speed=1.8,
-                    strength=MotionStrengthLevel.STRONG,
-                ),
-                timing=TimingControl(duration=3.0, fps=60, speed_factor=1.0),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.EXTREME,
-                    subject_motion=0.9,
-                    camera_motion=0.8,
-                    motion_blur=True,
-                    motion_blur_amount=0.7,
-                ),
-                transition=TransitionControl(style=TransitionStyle.SMASH_CUT),
-                style_preset=StylePreset.ACTION,
-                visual_style="dynamic",
-                mood="intense",
-                color_grade="high_contrast",
-                depth_of_field=0.3,
-                lighting_style="dramatic",
-                composition_rule="dynamic_diagonal",
-            )
 
-        elif preset_type == StylePreset.DRAMA:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.SLOW_PUSH,
-                    angle=CameraAngle.EYE_LEVEL,
-                    shot_type=ShotType.CLOSEUP,
-                    focal_length=85,
-                    speed=0.5,
-                    strength=MotionStrengthLevel.SUBTLE,
-                    easing="ease_in",
-                ),
-                timing=TimingControl(duration=6.0, fps=24),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.3, camera_motion=0.5
-                ),
-                transition=TransitionControl(style=TransitionStyle.CROSSFADE, duration=1.5),
-                style_preset=StylePreset.DRAMA,
-                visual_style="intimate",
-                mood="emotional",
-                color_grade="warm",
-                depth_of_field=0.2,
-                lighting_style="soft",
-                composition_rule="center_weighted",
-            )
+def _make_action() -> DirectorControls:
+    """Build the action style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.HANDHELD,
+            angle=CameraAngle.EYE_LEVEL,
+            shot_type=ShotType.MEDIUM,
+            focal_length=35,
+            speed=1.8,
+            strength=MotionStrengthLevel.STRONG,
+        ),
+        timing=TimingControl(duration=3.0, fps=60, speed_factor=1.0),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.EXTREME,
+            subject_motion=0.9,
+            camera_motion=0.8,
+            motion_blur=True,
+            motion_blur_amount=0.7,
+        ),
+        transition=TransitionControl(style=TransitionStyle.SMASH_CUT),
+        style_preset=StylePreset.ACTION,
+        visual_style="dynamic",
+        mood="intense",
+        color_grade="high_contrast",
+        depth_of_field=0.3,
+        lighting_style="dramatic",
+        composition_rule="dynamic_diagonal",
+    )
 
-        elif preset_type == StylePreset.MUSIC_VIDEO:
-            return DirectorControls(
-                mode=DirectorMode.PRO,
-                camera=CameraControl(
-                    movement_type=CameraMovementType.ORBIT,
-                    angle=CameraAngle.HIGH_ANGLE,
-                    shot_type=ShotType.FULL,
-                    focal_length=35,
-                    speed=1.2,
-                    strength=MotionStrengthLevel.STRONG,
-                    easing="ease_in_out",
-                ),
-                timing=TimingControl(duration=4.0, fps=30),
-                motion=MotionControl(
-                    overall_strength=MotionStrengthLevel.STRONG, subject_motion=0.7, camera_motion=0.9, motion_blur=True
-                ),
-                transition=TransitionControl(style=TransitionStyle.WIPE, duration=0.5),
-                style_preset=StylePreset.MUSIC_VIDEO,
-                visual_style="stylized",
-                mood="energetic",
-                color_grade="saturated",
-                depth_of_field=0.5,
-                lighting_style="theatrical",
-                composition_rule="balanced",
-            )
 
-        else:
-            # Default preset
-            return DirectorControls()
+def _make_drama() -> DirectorControls:
+    """Build the drama style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.SLOW_PUSH,
+            angle=CameraAngle.EYE_LEVEL,
+            shot_type=ShotType.CLOSEUP,
+            focal_length=85,
+            speed=0.5,
+            strength=MotionStrengthLevel.SUBTLE,
+            easing="ease_in",
+        ),
+        timing=TimingControl(duration=6.0, fps=24),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.SUBTLE, subject_motion=0.3, camera_motion=0.5
+        ),
+        transition=TransitionControl(style=TransitionStyle.CROSSFADE, duration=1.5),
+        style_preset=StylePreset.DRAMA,
+        visual_style="intimate",
+        mood="emotional",
+        color_grade="warm",
+        depth_of_field=0.2,
+        lighting_style="soft",
+        composition_rule="center_weighted",
+    )
+
+
+def _make_music_video() -> DirectorControls:
+    """Build the music video style preset"""
+    return DirectorControls(
+        mode=DirectorMode.PRO,
+        camera=CameraControl(
+            movement_type=CameraMovementType.ORBIT,
+            angle=CameraAngle.HIGH_ANGLE,
+            shot_type=ShotType.FULL,
+            focal_length=35,
+            speed=1.2,
+            strength=MotionStrengthLevel.STRONG,
+            easing="ease_in_out",
+        ),
+        timing=TimingControl(duration=4.0, fps=30),
+        motion=MotionControl(
+            overall_strength=MotionStrengthLevel.STRONG, subject_motion=0.7, camera_motion=0.9, motion_blur=True
+        ),
+        transition=TransitionControl(style=TransitionStyle.WIPE, duration=0.5),
+        style_preset=StylePreset.MUSIC_VIDEO,
+        visual_style="stylized",
+        mood="energetic",
+        color_grade="saturated",
+        depth_of_field=0.5,
+        lighting_style="theatrical",
+        composition_rule="balanced",
+    )
+
+
+_PRESET_FACTORIES: Dict[StylePreset, Callable[[], DirectorControls]] = {
+    StylePreset.DOCUMENTARY: _make_documentary,
+    StylePreset.COMMERCIAL: _make_commercial,
+    StylePreset.ART_HOUSE: _make_art_house,
+    StylePreset.ACTION: _make_action,
+    StylePreset.DRAMA: _make_drama,
+    StylePreset.MUSIC_VIDEO: _make_music_video,
+}
+
+
+class PresetLibrary:
+    """Library of professional style presets"""
+
+    @staticmethod
+    def get_preset(preset_type: StylePreset) -> DirectorControls:
+        """Get a predefined style preset"""
+        # Presets without a factory fall back to the default controls
+        return _PRESET_FACTORIES.get(preset_type, DirectorControls)()
 
     @staticmethod
     def list_presets() -> List[Dict[str, str]]:
@@ -734,6 +1051,34 @@ class PresetLibrary:
         ]
 
 
+def _set_transition_param(controls: DirectorControls, name: str, value: Any) -> None:
+    if controls.transition is not None:
+        setattr(controls.transition, name, value)
+
+
+def _settable_fields(cls: type) -> frozenset:
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+# Field names accepted by create_variation, checked up front so an unknown
+# path fails the same way whether or not the dataclasses use __slots__
+_CONTROL_FIELDS = _settable_fields(DirectorControls)
+_COMPONENT_FIELDS: Dict[str, frozenset] = {
+    "camera": _settable_fields(CameraControl),
+    "timing": _settable_fields(TimingControl),
+    "motion": _settable_fields(MotionControl),
+    "transition": _settable_fields(TransitionControl),
+}
+
+# Setters for "component.field" parameter paths, keyed on the component name
+_PARAM_SETTERS: Dict[str, Callable[[DirectorControls, str, Any], None]] = {
+    "camera": lambda controls, name, value: setattr(controls.camera, name, value),
+    "timing": lambda controls, name, value: setattr(controls.timing, name, value),
+    "motion": lambda controls, name, value: setattr(controls.motion, name, value),
+    "transition": _set_transition_param,
+}
+
+
 class IterationWorkflow:
     """Manages iteration and refinement workflow"""
 
@@ -743,9 +1088,8 @@ class IterationWorkflow:
 
     def create_variation(self, parameter_changes: Dict[str, Any], preserve_locked: bool = True) -> DirectorControls:
         """Create a variation with modified parameters"""
-        # Start with current controls
-        variation = DirectorControls.from_dict(self.controls.to_dict())
-        variation.control_id = str(uuid.uuid4())
+        # Start with a copy of the current controls
+        variation = self.controls.clone()
 
         # Apply changes
         for param, value in parameter_changes.items():
@@ -760,51 +1104,61 @@ class IterationWorkflow:
         return variation
 
     def _apply_parameter_change(self, controls: DirectorControls, param_path: str, value: Any):
-        """Apply a parameter change to controls"""
-        parts = param_path.split(".")
-
-        if parts[0] == "camera":
-            if len(parts) > 1:
-                setattr(controls.camera, parts[1], value)
-        elif parts[0] == "timing":
-            if len(parts) > 1:
-                setattr(controls.timing, parts[1], value)
-        elif parts[0] == "motion":
-            if len(parts) > 1:
-                setattr(controls.motion, parts[1], value)
-        elif parts[0] == "transition":
-            if controls.transition and len(parts) > 1:
-                setattr(controls.transition, parts[1], value)
-        else:
-            setattr(controls, parts[0], value)
+        """Apply a parameter change to controls
+
+        Raises:
+            ValueError: If the path does not name a DirectorControls field
+                or a field of one of its components.
+        """
+        root, sep, name = param_path.partition(".")
+        name = name.partition(".")[0]
+        setter = _PARAM_SETTERS.get(root)
+        if setter is None:
+            if root not in _CONTROL_FIELDS:
+                raise ValueError(f"Unknown parameter path: {param_path!r}")
+            setattr(controls, root, value)
+        elif sep:
+            if name not in _COMPONENT_FIELDS[root]:
+                raise ValueError(f"Unknown parameter path: {param_path!r}")
+            setter(controls, name, value)
 
     def compare_generations(self, generations: List[GenerationComparison]) -> Dict[str, Any]:
         """Compare multiple generations and provide analysis"""
         if not generations:
             return {"error": "No generations to compare"}
 
+        gen_infos = []
+        best = None
+        rated_count = 0
+        rating_total = 0
+
+        # Single pass: collect summaries while tracking the best and the running total
+        for gen in generations:
+            rating = gen.rating
+            gen_infos.append(
+                {
+                    "generation_id": gen.generation_id,
+                    "rating": rating,
+                    "created_at": gen.created_at_iso,
+                    "notes": gen.notes,
+                    "thumbnail": gen.thumbnail_url,
+                }
+            )
+            if rating is not None:
+                rated_count += 1
+                rating_total += rating
+                if best is None or rating > best.rating:
+                    best = gen
+
         comparison = {
             "total_generations": len(generations),
-            "rated_count": len([g for g in generations if g.rating is not None]),
-            "generations": [],
+            "rated_count": rated_count,
+            "generations": gen_infos,
         }
 
-        # Sort by rating
-        sorted_gens = sorted([g for g in generations if g.rating is not None], key=lambda x: x.rating, reverse=True)
-
-        for gen in generations:
-            gen_info = {
-                "generation_id": gen.generation_id,
-                "rating": gen.rating,
-                "created_at": gen.created_at,
-                "notes": gen.notes,
-                "thumbnail": gen.thumbnail_url,
-            }
-            comparison["generations"].append(gen_info)
-
-        if sorted_gens:
-            comparison["best_generation"] = sorted_gens[0].generation_id
-            comparison["average_rating"] = sum(g.rating for g in sorted_gens) / len(sorted_gens)
+        if best is not None:
+            comparison["best_generation"] = best.generation_id
+            comparison["average_rating"] = rating_total / rated_count
 
         return comparison
 
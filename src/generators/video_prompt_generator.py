@@ -8,7 +8,7 @@ Enhanced with video-specific controls and versioning.
 
 import json
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 import hashlib
 
@@ -20,6 +20,23 @@ from src.analyzers.video_prompt_analyzer import (
     VideoPromptAnalyzer,
 )
 
+# Temporal consistency presets by priority; configs are immutable, so these
+# are shared and per-scene values are applied with dataclasses.replace
+_TEMPORAL_PRESETS = {
+    "low": TemporalConsistencyConfig(
+        temporal_weight=0.5, motion_strength=0.7, frame_interpolation=24, guidance_scale=7.0
+    ),
+    "medium": TemporalConsistencyConfig(
+        temporal_weight=0.7, motion_strength=0.5, frame_interpolation=30, guidance_scale=7.5
+    ),
+    "high": TemporalConsistencyConfig(
+        temporal_weight=0.85, motion_strength=0.4, frame_interpolation=30, guidance_scale=8.0
+    ),
+    "critical": TemporalConsistencyConfig(
+        temporal_weight=0.95, motion_strength=0.3, frame_interpolation=60, guidance_scale=9.0
+    ),
+}
+
 
 @dataclass
 class VideoControlParameters:
@@ -191,9 +208,7 @@ class VideoPromptCompiler:
     ):
         """Initialize compiler with catalogs and rules"""
         self.analyzer = VideoPromptAnalyzer(catalog_path)
-
-        with open(catalog_path, "r", encoding="utf-8") as f:
-            self.catalog = json.load(f)
+        self.catalog = self.analyzer.catalog
 
         with open(rules_path, "r", encoding="utf-8") as f:
             self.cinematic_rules = json.load(f)
@@ -306,7 +321,7 @@ class VideoPromptCompiler:
                     apply_rule = True
                     if "Composition-Guided" in rule_name:
                         enhancements["camera_composition"] = (
-                            f"{control_params.camera_motion.to_prompt_string()} "
+                            f"{control_params.camera_motion.prompt_string} "
                             "following compositional flow and leading lines"
                         )
                     elif "Depth Layer Parallax" in rule_name:
@@ -365,25 +380,10 @@ class VideoPromptCompiler:
         prompt_text: Optional[str] = None,
     ) -> TemporalConsistencyConfig:
         """Generate temporal consistency configuration with determinism"""
-        configs = {
-            "low": TemporalConsistencyConfig(
-                temporal_weight=0.5, motion_strength=0.7, frame_interpolation=24, guidance_scale=7.0
-            ),
-            "medium": TemporalConsistencyConfig(
-                temporal_weight=0.7, motion_strength=0.5, frame_interpolation=30, guidance_scale=7.5
-            ),
-            "high": TemporalConsistencyConfig(
-                temporal_weight=0.85, motion_strength=0.4, frame_interpolation=30, guidance_scale=8.0
-            ),
-            "critical": TemporalConsistencyConfig(
-                temporal_weight=0.95, motion_strength=0.3, frame_interpolation=60, guidance_scale=9.0
-            ),
-        }
-
-        config = configs.get(priority, configs["high"])
+        config = _TEMPORAL_PRESETS.get(priority, _TEMPORAL_PRESETS["high"])
 
         if determinism and determinism.enable_seed_management:
-            config.seed = determinism.generate_seed(scene_index, prompt_text)
+            config = replace(config, seed=determinism.generate_seed(scene_index, prompt_text))
 
         return config
 
@@ -406,7 +406,7 @@ class VideoPromptCompiler:
             request.scene_description,
         )
 
-        temporal_config.motion_strength = motion_strength
+        temporal_config = replace(temporal_config, motion_strength=motion_strength)
 
         structure = PromptStructure(
             subject=components.get("subject", ""),
@@ -559,7 +559,9 @@ class VideoPromptCompiler:
         is_valid, messages = self.analyzer.validate_parameters(compiled_prompt.model_type, parameters)
 
         if is_valid:
-            parameters = self.analyzer.optimize_for_temporal_consistency(compiled_prompt.model_type, parameters)
+            parameters = self.analyzer.optimize_for_temporal_consistency(
+                compiled_prompt.model_type, parameters, copy=False
+            )
 
         return parameters
 
@@ -681,7 +683,7 @@ class VideoPromptGenerator(VideoPromptCompiler):
             if "Composition-Guided" in rule_id:
                 enhancements["enhanced_components"][
                     "camera"
-                ] = f"{structure.camera.to_prompt_string()}, following compositional elements"
+                ] = f"{structure.camera.prompt_string}, following compositional elements"
 
             if "Emotional Framing" in rule_id:
                 enhancements["enhanced_components"][
@@ -7,6 +7,7 @@ import os
 import tempfile
 import threading
 import uuid
+from dataclasses import replace
 from datetime import datetime, timezone
 from functools import partial
 from pathlib import Path
@@ -454,7 +455,8 @@ def _variant_camera(index: int, motion_strength: float) -> CameraMotion:
         CameraMotion(type="crane", speed="slow", direction="up", focal_length=50),
     ]
     motion = motions[index % len(motions)]
-    motion.speed = "medium" if motion_strength > 0.7 else motion.speed
+    if motion_strength > 0.7:
+        motion = replace(motion, speed="medium")
     return motion
 
 
@@ -504,8 +506,8 @@ class SequenceJob:
         """Snapshot history and register a live queue atomically.
 
         Must be called from a running event loop. If the job already finished,
-        no queue is registered and the terminal event is returned for
-        immediate replay.
+        no queue is registered and the stage history plus terminal event are
+        returned for immediate replay.
         """
         queue: asyncio.Queue = asyncio.Queue()
         loop = asyncio.get_running_loop()
@@ -620,9 +622,10 @@ def _execute_sequence_run(
                     ),
                 ) from error
 
-            scene_analyzer = SceneAnalyzer(config_path=str(CONFIG_DIR / "scene_analyzer.json"))
             movement_predictor = MovementPredictor(config_path=str(CONFIG_DIR / "movement_prediction_rules.json"))
-            scene_analysis = scene_analyzer.analyze_image(str(image_path))
+            # Close the analyzer so its stage thread pool ends with the request
+            with SceneAnalyzer(config_path=str(CONFIG_DIR / "scene_analyzer.json")) as scene_analyzer:
+                scene_analysis = scene_analyzer.analyze_image(str(image_path))
             movement_analysis = movement_predictor.analyze_image(str(image_path))
             movement_prompt = movement_predictor.get_cinematic_movement_prompt(str(image_path))
             object_count = len(scene_analysis.get("objects", []))
@@ -1287,7 +1290,9 @@ async def sequence_events(run_id: str) -> StreamingResponse:
     async def stream():
         queue, history, terminal = job.subscribe()
         if terminal is not None:
-            # Late subscriber: replay the terminal event and close.
+            # Late subscriber: replay the stage history and terminal event, then close.
+            for name, data in history:
+                yield _sse_event(name, data)
             yield _sse_event(*terminal)
             return
         try:
@@ -297,6 +297,25 @@ def test_stream_happy_path_stage_events_and_done(client: TestClient):
     assert not missing, f"'done' payload missing sync run keys: {sorted(missing)}"
 
 
+def test_stream_run_closes_scene_analyzer(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    from src.analyzers.scene_analyzer import SceneAnalyzer
+
+    closed = []
+    original_close = SceneAnalyzer.close
+
+    def _recording_close(self):
+        closed.append(self)
+        original_close(self)
+
+    monkeypatch.setattr(SceneAnalyzer, "close", _recording_close)
+
+    started = _start_async_run(client)
+    events = _collect_sse_events(client, started["stream_url"])
+    assert events and events[-1][0] == "done"
+    # The analyzer's stage thread pool must not outlive the request
+    assert len(closed) == 1
+
+
 def test_late_subscriber_replays_terminal_event(client: TestClient):
     started = _start_async_run(client)
     run_id = started["run_id"]
@@ -304,10 +323,11 @@ def test_late_subscriber_replays_terminal_event(client: TestClient):
     first_pass = _collect_sse_events(client, started["stream_url"])
     assert first_pass and first_pass[-1][0] in TERMINAL_EVENTS
 
-    # Reconnect after completion: the terminal event replays immediately and
-    # the stream terminates again.
+    # Reconnect after completion: the stage history and terminal event replay
+    # immediately and the stream terminates again.
     replay = _collect_sse_events(client, started["stream_url"])
     assert replay, "late subscriber received no events"
+    assert replay[:-1] == first_pass[:-1], "late subscriber missed the stage history"
     replay_name, replay_data = replay[-1]
     assert replay_name == first_pass[-1][0]
     assert isinstance(replay_data, dict)
@@ -63,6 +63,18 @@ class TestCameraControl:
         assert params['camera_motion']['strength'] == 'moderate'
         assert params['camera_angle'] == 'eye_level'
         assert params['shot_type'] == 'medium'
+    
+    def test_camera_internal_params_track_changes(self):
+        camera = CameraControl(movement_type=CameraMovementType.DOLLY, speed=0.8)
+        params = camera.to_internal_params()
+        params['camera_motion']['speed'] = 3.0
+        assert camera.to_internal_params()['camera_motion']['speed'] == 0.8
+        
+        camera.speed = 1.5
+        camera.movement_type = CameraMovementType.ORBIT
+        params = camera.to_internal_params()
+        assert params['camera_motion']['speed'] == 1.5
+        assert params['camera_motion']['type'] == 'orbit'
 
 
 class TestTimingControl:
@@ -161,6 +173,20 @@ class TestDirectorControls:
         controls = DirectorControls(mode=DirectorMode.PRO)
         assert controls.mode == DirectorMode.PRO
     
+    def test_validate_fail_fast(self):
+        controls = DirectorControls()
+        assert controls.is_valid()
+        
+        controls.camera.focal_length = 500
+        controls.timing.fps = 23
+        assert not controls.is_valid()
+        
+        full = controls.validate()
+        fast = controls.validate(fail_fast=True)
+        assert len(full["errors"]) == 2
+        assert not fast["valid"]
+        assert fast["errors"] == full["errors"][:1]
+    
     def test_to_internal_params(self):
         controls = DirectorControls(mode=DirectorMode.PRO)
         controls.camera.movement_type = CameraMovementType.DOLLY
@@ -172,6 +198,12 @@ class TestDirectorControls:
         assert params['duration'] == 7.0
         assert params['fps'] == 24
         assert 'motion_strength' in params
+        
+        params['motion_strength'] = 'strong'
+        params['focal_length'] = 85
+        again = controls.to_internal_params()
+        assert again['motion_strength'] == 'moderate'
+        assert again['focal_length'] == 50
     
     def test_parameter_locking(self):
         controls = DirectorControls()
@@ -182,6 +214,7 @@ class TestDirectorControls:
         assert controls.locked_parameters["camera.speed"].locked is True
         assert controls.locked_parameters["camera.speed"].locked_value == 0.8
         assert controls.locked_parameters["camera.speed"].notes == "Perfect speed"
+        assert controls.modified_at == controls.locked_parameters["camera.speed"].locked_at_iso
     
     def test_parameter_unlocking(self):
         controls = DirectorControls()
@@ -233,10 +266,50 @@ class TestDirectorControls:
         assert restored.camera.movement_type == CameraMovementType.DOLLY
         assert restored.timing.duration == 7.0
 
+    def test_to_dict_restores_locks_and_history(self):
+        controls = DirectorControls(transition=TransitionControl(style=TransitionStyle.FADE))
+        controls.lock_parameter("timing.fps", 30)
+        controls.add_comparison(GenerationComparison(generation_id="gen_001", parameters={"fps": 30}, rating=4))
+        
+        data = controls.to_dict()
+        assert data["mode"] == "auto"
+        assert data["transition"]["style"] == "fade"
+        
+        restored = DirectorControls.from_dict(data)
+        assert isinstance(restored.locked_parameters["timing.fps"], ParameterLock)
+        assert restored.get_best_generation().generation_id == "gen_001"
+        assert restored.to_dict() == data
+        
+        data.pop("modified_at")
+        stamped = DirectorControls.from_dict(data)
+        assert stamped.created_at == controls.created_at
+        assert stamped.modified_at >= controls.modified_at
+    
+    def test_json_round_trip(self):
+        controls = PresetLibrary.get_preset(StylePreset.COMMERCIAL)
+        controls.lock_parameter("timing.fps", 30, "30fps looks best")
+        
+        payload = controls.to_json()
+        assert json.loads(payload) == controls.to_dict()
+        
+        restored = DirectorControls.from_json(payload)
+        assert restored.to_dict() == controls.to_dict()
+        assert DirectorControls.from_json(payload.encode("utf-8")).control_id == controls.control_id
+
 
 class TestPresetLibrary:
     """Tests for PresetLibrary"""
     
+    def test_get_preset_returns_independent_controls(self):
+        first = PresetLibrary.get_preset(StylePreset.ACTION)
+        second = PresetLibrary.get_preset(StylePreset.ACTION)
+        assert first.control_id != second.control_id
+        
+        first.camera.speed = 4.0
+        first.lock_parameter("timing.fps", 60)
+        assert second.camera.speed != 4.0
+        assert second.locked_parameters == {}
+    
     def test_list_presets(self):
         presets = PresetLibrary.list_presets()
         assert len(presets) == 6
@@ -298,6 +371,48 @@ class TestIterationWorkflow:
         
         assert variation.camera.speed == 1.5
         assert variation.control_id != controls.control_id
+        assert controls.camera.speed == 1.0
+    
+    def test_clone_is_independent(self):
+        controls = PresetLibrary.get_preset(StylePreset.COMMERCIAL)
+        controls.lock_parameter("timing.fps", 30)
+        
+        clone = controls.clone()
+        original = controls.to_dict()
+        copied = clone.to_dict()
+        assert copied.pop("control_id") != original.pop("control_id")
+        assert copied == original
+        
+        clone.unlock_parameter("timing.fps")
+        clone.transition.parameters["softness"] = 0.5
+        assert controls.locked_parameters["timing.fps"].locked
+        assert controls.transition.parameters == {}
+    
+    def test_create_variation_parameter_paths(self):
+        controls = DirectorControls()
+        workflow = IterationWorkflow(controls)
+        variation = workflow.create_variation({
+            "timing.fps": 30,
+            "motion.subject_motion": 0.8,
+            "mode": DirectorMode.PRO,
+            "transition.duration": 2.0,
+            "camera": "ignored",
+        })
+        
+        assert variation.timing.fps == 30
+        assert variation.motion.subject_motion == 0.8
+        assert variation.mode == DirectorMode.PRO
+        assert variation.transition is None
+        assert isinstance(variation.camera, CameraControl)
+    
+    def test_create_variation_rejects_unknown_paths(self):
+        workflow = IterationWorkflow(DirectorControls())
+        
+        for changes in ({"foo": 1}, {"camera.bogus": 3}, {"transition.bogus": 1.0}):
+            with pytest.raises(ValueError, match="Unknown parameter path"):
+                workflow.create_variation(changes)
+        
+        assert workflow.controls.camera.speed == CameraControl().speed
     
     def test_create_variation_respects_locks(self):
         controls = DirectorControls()
@@ -330,6 +445,27 @@ class TestIterationWorkflow:
         assert comparison['best_generation'] == "gen_002"
         assert comparison['average_rating'] == 4.0
     
+    def test_compare_generations_skips_unrated(self):
+        workflow = IterationWorkflow(DirectorControls())
+        
+        generations = [
+            GenerationComparison("gen_001", {}),
+            GenerationComparison("gen_002", {}, rating=4),
+            GenerationComparison("gen_003", {}, rating=4),
+            GenerationComparison("gen_004", {}, rating=1)
+        ]
+        
+        comparison = workflow.compare_generations(generations)
+        
+        assert comparison['rated_count'] == 3
+        assert len(comparison['generations']) == 4
+        assert comparison['best_generation'] == "gen_002"
+        assert comparison['average_rating'] == 3.0
+        
+        unrated = workflow.compare_generations(generations[:1])
+        assert 'best_generation' not in unrated
+        assert 'average_rating' not in unrated
+    
     def test_suggest_refinements_speed(self):
         controls = DirectorControls()
         controls.camera.speed = 1.8
@@ -425,6 +561,21 @@ class TestGenerationComparison:
         assert comp.rating == 4
         assert comp.notes == "Good result"
         assert comp.created_at is not None
+    
+    def test_created_at_nanoseconds_and_iso(self):
+        comp = GenerationComparison(
+            generation_id="gen_001",
+            parameters={},
+            created_at="2024-01-02T03:04:05.123456"
+        )
+        
+        assert comp.created_at == 1704164645123456000
+        assert comp.created_at_iso == "2024-01-02T03:04:05.123456"
+        assert comp.to_dict()["created_at"] == comp.created_at_iso
+        
+        later = GenerationComparison(generation_id="gen_002", parameters={})
+        assert isinstance(later.created_at, int)
+        assert later.created_at > comp.created_at
 
 
 class TestIntegration:
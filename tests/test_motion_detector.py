@@ -12,11 +12,13 @@ import tempfile
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path for imports
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.analyzers import motion_detector
 from src.analyzers.motion_detector import MotionDetector
 
 
@@ -151,6 +153,21 @@ class TestMotionDetector(unittest.TestCase):
         patterns = self.detector._classify_motion_patterns(distributed_events)
         # The classification might not always return "distributed" due to simple clustering
     
+    def test_optical_flow_buffer_reuse(self):
+        """Test that reusing the flow buffer does not change the result."""
+        rng = np.random.default_rng(0)
+        texture = cv2.GaussianBlur((rng.random((120, 200)) * 255).astype(np.uint8), (0, 0), 2)
+        prev_frame = np.ascontiguousarray(texture[:, :160])
+        curr_frame = np.ascontiguousarray(texture[:, 3:163])
+        
+        first = self.detector._calculate_optical_flow(prev_frame, curr_frame)
+        second = self.detector._calculate_optical_flow(prev_frame, curr_frame)
+        fresh = MotionDetector()._calculate_optical_flow(prev_frame, curr_frame)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first, fresh)
+        self.assertGreater(first["magnitude"], 1.0)
+        
     def test_summary_generation(self):
         """Test summary generation."""
         motion_data = {
@@ -241,6 +258,58 @@ class TestMotionDetector(unittest.TestCase):
             if os.path.exists(temp_dir):
                 os.rmdir(temp_dir)
     
+    def test_analysis_cache_roundtrip(self):
+        """Test that repeat analysis of an unchanged video hits the disk cache."""
+        self.assertFalse(self.detector.config['cache_results'])
+        
+        video_path, temp_dir = self.test_create_test_video()
+        cache_dir = tempfile.mkdtemp()
+        self.detector.config['cache_results'] = True
+        self.detector.config['cache_dir'] = cache_dir
+        
+        try:
+            first = self.detector.analyze_video(video_path)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            
+            second = MotionDetector()
+            second.config.update(self.detector.config)
+            cached = second.analyze_video(video_path)
+            
+            self.assertEqual(cached["timestamp"], first["timestamp"])
+            self.assertEqual(cached["summary"]["total_motion_events"],
+                             first["summary"]["total_motion_events"])
+            
+            # A new cache version must not reuse results from older code
+            current_path = second._cache_path(video_path)
+            with mock.patch.object(motion_detector, 'ANALYSIS_CACHE_VERSION',
+                                   motion_detector.ANALYSIS_CACHE_VERSION + 1):
+                self.assertNotEqual(second._cache_path(video_path), current_path)
+            
+        finally:
+            for directory in (temp_dir, cache_dir):
+                for name in os.listdir(directory):
+                    os.remove(os.path.join(directory, name))
+                os.rmdir(directory)
+    
+    def test_executor_reused_until_closed(self):
+        """Test that one labeling pool serves every video until close()."""
+        video_path, temp_dir = self.test_create_test_video()
+        
+        try:
+            with MotionDetector() as detector:
+                detector.analyze_video(video_path)
+                executor = detector._executor
+                self.assertIsNotNone(executor)
+                
+                detector.analyze_video(video_path)
+                self.assertIs(detector._executor, executor)
+            
+            self.assertIsNone(detector._executor)
+            
+        finally:
+            os.remove(video_path)
+            os.rmdir(temp_dir)
+    
     def test_error_handling(self):
         """Test error handling for invalid inputs."""
         with self.assertRaises(FileNotFoundError):
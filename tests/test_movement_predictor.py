@@ -16,6 +16,7 @@ from PIL import Image
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
+from src.analyzers import movement_predictor
 from src.analyzers.movement_predictor import MovementPredictor
 
 class TestMovementPredictor(unittest.TestCase):
@@ -120,6 +121,51 @@ class TestMovementPredictor(unittest.TestCase):
         vegetation_moves = [m for m in env_moves if 'vegetation' in m['element'].lower()]
         self.assertTrue(len(vegetation_moves) > 0)
     
+    def test_reduced_decode_by_dimensions(self):
+        """Test that large images decode at half size but report full dimensions"""
+        # A flat 3001x2001 PNG is tiny on disk yet exceeds the side limit
+        large_path = os.path.join(self.temp_dir, "large.png")
+        cv2.imwrite(large_path, np.full((2001, 3001, 3), 128, dtype=np.uint8))
+        small_path = self.standing_img_path
+        
+        large = self.predictor.analyze_image(large_path)
+        small = self.predictor.analyze_image(small_path)
+        
+        self.assertLess(os.path.getsize(large_path), 1024 * 1024)
+        self.assertEqual(large["image_size"], [3001, 2001])
+        self.assertEqual(small["image_size"], [300, 400])
+        
+        stat = os.stat(large_path)
+        prepared = movement_predictor._load_and_prep(
+            os.path.abspath(large_path), stat.st_mtime_ns, stat.st_size
+        )
+        self.assertEqual(prepared.decode_factor, 2)
+        self.assertEqual(prepared.bgr.shape[:2], (1000, 1500))
+    
+    def test_prep_cache_byte_budget(self):
+        """Test that the decoded-image cache stays within its byte budget"""
+        cache = movement_predictor._PrepCache(max_bytes=10 * 1024 * 1024)
+        paths = [os.path.abspath(p) for p in (self.standing_img_path, self.horizontal_img_path)]
+        keys = [(p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths]
+        
+        first = cache.get(*keys[0])
+        self.assertIs(cache.get(*keys[0]), first)
+        second = cache.get(*keys[1])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, movement_predictor._prepared_nbytes(first)
+                         + movement_predictor._prepared_nbytes(second))
+        
+        # Shrinking the budget evicts least recently used entries first
+        cache.resize(movement_predictor._prepared_nbytes(second))
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get(*keys[1]), second)
+        
+        # A zero budget disables caching entirely
+        cache.resize(0)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNot(cache.get(*keys[1]), cache.get(*keys[1]))
+        self.assertEqual(cache.nbytes, 0)
+    
     def test_character_movement_analysis(self):
         """Test character movement analysis specifically"""
         cv_image = cv2.imread(self.standing_img_path)
@@ -146,6 +192,18 @@ class TestMovementPredictor(unittest.TestCase):
             self.assertIn('justification', move)
             self.assertIn('confidence', move)
     
+    def test_sparse_edges_skip_hough(self):
+        """Test that edge maps below the density floor only get default moves"""
+        sparse = np.full((400, 600, 3), 180, dtype=np.uint8)
+        cv2.line(sparse, (100, 200), (400, 200), (0, 0, 0), 1)
+        gray = cv2.cvtColor(sparse, cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        self.assertLess(cv2.countNonZero(edges), 0.01 * edges.size)
+        
+        camera_moves = self.predictor._analyze_camera_movement(sparse, gray, edges)
+        self.assertEqual([move['type'] for move in camera_moves],
+                         ['slow_push', 'subtle_tilt'])
+    
     def test_environmental_motion_analysis(self):
         """Test environmental motion analysis specifically"""
         cv_image = cv2.imread(self.green_img_path)
@@ -158,6 +216,32 @@ class TestMovementPredictor(unittest.TestCase):
             self.assertIn('justification', move)
             self.assertIn('confidence', move)
     
+    def test_analyze_images_batch(self):
+        """Test parallel batch analysis preserves input order"""
+        paths = [self.standing_img_path, self.horizontal_img_path, self.green_img_path]
+        analyses = self.predictor.analyze_images(paths, workers=2)
+        
+        self.assertEqual(len(analyses), len(paths))
+        for path, analysis in zip(paths, analyses):
+            self.assertNotIn('error', analysis)
+            self.assertEqual(analysis['image_path'], path)
+        
+        self.assertEqual(self.predictor.analyze_images([]), [])
+    
+    def test_analyze_batch_matches_single_frame(self):
+        """Test stacked environmental analysis agrees with per-frame analysis"""
+        frames = np.stack([
+            cv2.imread(self.green_img_path),
+            cv2.imread(self.horizontal_img_path),
+            cv2.imread(self.diagonal_img_path)
+        ])
+        
+        batch = self.predictor.analyze_batch(frames)
+        
+        self.assertEqual(len(batch), len(frames))
+        for frame, env_moves in zip(frames, batch):
+            self.assertEqual(env_moves, self.predictor._analyze_environmental_motion(frame))
+    
     def test_movement_justification_validation(self):
         """Test movement justification validation"""
         valid_movement = {
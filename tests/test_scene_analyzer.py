@@ -132,6 +132,19 @@ class TestSceneAnalyzer:
         assert "horizontal_symmetry" in symmetry
         assert 0 <= symmetry["horizontal_symmetry"] <= 1
     
+    def test_edge_density_matches_canny(self):
+        """Edge density is the Canny(50, 150) edge-pixel fraction"""
+        analyzer = SceneAnalyzer()
+        rng = np.random.default_rng(0)
+        noise = (rng.random((400, 600, 3)) * 255).astype(np.uint8)
+        
+        for img_array in (self.test_create_test_image(), noise):
+            gray = cv2.cvtColor(img_array, cv2.COLOR_BGR2GRAY)
+            expected = cv2.countNonZero(cv2.Canny(gray, 50, 150)) / gray.size
+            
+            complexity = analyzer._analyze_composition(img_array)["complexity"]
+            assert complexity["edge_density"] == round(expected, 3)
+    
     def test_scene_classification(self):
         """Test scene classification"""
         analyzer = SceneAnalyzer()
@@ -147,6 +160,49 @@ class TestSceneAnalyzer:
         assert scene["confidence"] >= 0
         assert scene["confidence"] <= 1
     
+    def test_shared_image_context(self):
+        """Stages give the same results from a prepared context as from raw pixels"""
+        analyzer = SceneAnalyzer()
+        img_array = self.test_create_test_image()
+        ctx = analyzer._build_context(img_array)
+        
+        assert ctx.masks.shape == (5, 400, 600)
+        assert analyzer._detect_objects_fallback(ctx) == analyzer._detect_objects_fallback(img_array)
+        assert analyzer._estimate_depth_fallback(ctx) == analyzer._estimate_depth_fallback(img_array)
+        assert analyzer._analyze_composition(ctx) == analyzer._analyze_composition(img_array)
+        assert analyzer._classify_scene(ctx) == analyzer._classify_scene(img_array)
+    
+    def test_threaded_stages_match_serial(self):
+        """Running the stages on worker threads does not change the results"""
+        analyzer = SceneAnalyzer()
+        ctx = analyzer._build_context(self.test_create_test_image())
+        
+        analyzer.config["stage_workers"] = 1
+        serial = analyzer._run_stages(ctx)
+        analyzer.config["stage_workers"] = 3
+        threaded = analyzer._run_stages(ctx)
+        
+        assert threaded == serial
+    
+    def test_stage_executor_reused_until_closed(self):
+        """One stage thread pool serves every image until close()"""
+        ctx = SceneAnalyzer()._build_context(self.test_create_test_image())
+        
+        with SceneAnalyzer() as analyzer:
+            analyzer.config["stage_workers"] = 3
+            analyzer._run_stages(ctx)
+            executor = analyzer._stage_executor
+            assert executor is not None
+            
+            analyzer._run_stages(ctx)
+            assert analyzer._stage_executor is executor
+        
+        assert analyzer._stage_executor is None
+        
+        analyzer.config["stage_workers"] = 1
+        analyzer._run_stages(ctx)
+        assert analyzer._stage_executor is None
+    
     def test_aesthetics_calculation(self):
         """Test aesthetics score calculation"""
         analyzer = SceneAnalyzer()
@@ -200,6 +256,53 @@ class TestSceneAnalyzer:
         assert "error" in result
         assert "error_message" in result
     
+    def test_analysis_cache_bounded(self):
+        """Cache is LRU-bounded and invalidated when the file changes"""
+        analyzer = SceneAnalyzer()
+        analyzer.config["cache_size"] = 2
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(3):
+                img_path = str(Path(temp_dir) / f"cache_{i}.png")
+                cv2.imwrite(img_path, self.test_create_test_image())
+                paths.append(img_path)
+            
+            first = analyzer.analyze_image(paths[0])
+            assert analyzer.analyze_image(paths[0]) is first
+            
+            for img_path in paths[1:]:
+                analyzer.analyze_image(img_path)
+            assert len(analyzer.analysis_cache) == 2
+            assert analyzer.analyze_image(paths[0]) is not first
+            
+            # Rewriting the file changes its size/mtime and so the cache key
+            cached = analyzer.analyze_image(paths[2])
+            cv2.imwrite(paths[2], np.zeros((50, 60, 3), dtype=np.uint8))
+            assert analyzer.analyze_image(paths[2]) is not cached
+    
+    def test_large_image_downsampled(self):
+        """Large inputs are segmented downscaled but reported in original coordinates"""
+        analyzer = SceneAnalyzer()
+        analyzer.config["analysis_max_side"] = 300
+        full_res = SceneAnalyzer()
+        full_res.config["analysis_max_side"] = 0
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            img_path = str(Path(temp_dir) / "large.png")
+            cv2.imwrite(img_path, self.test_create_test_image())
+            analysis = analyzer.analyze_image(img_path)
+            reference = full_res.analyze_image(img_path)
+        
+        assert "error" not in analysis
+        # Resolution-dependent metrics are always measured at full size
+        assert analysis["composition"] == reference["composition"]
+        assert analysis["depth"] == pytest.approx(reference["depth"])
+        assert analysis["composition"]["rule_of_thirds"]["key_points"][0] == [200, 133]
+        sky = next(obj for obj in analysis["objects"] if obj["class"] == "sky")
+        assert sky["bbox"][2] == 600
+        assert abs(sky["bbox"][3] - 100) <= 2
+    
     def test_batch_analysis_structure(self):
         """Test batch analysis structure"""
         analyzer = SceneAnalyzer()
@@ -2,6 +2,9 @@
 Unit tests for Video Prompt Analyzer and Generator
 """
 
+import copy
+import dataclasses
+import json
 import unittest
 from src.analyzers.video_prompt_analyzer import (
     VideoPromptAnalyzer,
@@ -10,6 +13,7 @@ from src.analyzers.video_prompt_analyzer import (
     CameraMotion,
     TemporalConsistencyConfig,
     SceneTransition,
+    DEFAULT_TEMPORAL_CONFIG,
 )
 from src.generators.video_prompt_generator import (
     VideoPromptCompiler,
@@ -68,6 +72,13 @@ class TestCameraMotion(unittest.TestCase):
         self.assertIn("slow", prompt.lower())
         self.assertIn("50mm", prompt.lower())
 
+    def test_prompt_string_cached(self):
+        """Test prompt string is built once and the camera is immutable"""
+        camera = CameraMotion(type="pan", speed="slow", direction="left")
+        self.assertIs(camera.prompt_string, camera.to_prompt_string())
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            camera.type = "tilt"
+
 
 class TestPromptStructure(unittest.TestCase):
     """Test PromptStructure generation"""
@@ -105,6 +116,25 @@ class TestPromptStructure(unittest.TestCase):
         self.assertIn("scene:", prompt.lower())
         self.assertIn("lighting:", prompt.lower())
 
+    def test_default_temporal_config_shared(self):
+        """Test scenes without a config share the immutable default"""
+        self.assertIs(self.structure.temporal_config, DEFAULT_TEMPORAL_CONFIG)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.structure.temporal_config.seed = 1
+
+    def test_text_fields_interned(self):
+        """Test repeated phrases share one string object across scenes"""
+        other = PromptStructure(
+            subject="".join(["A young woman ", "in a red dress"]),
+            action="walking through",
+            environment="a misty forest",
+            lighting="golden hour sunlight",
+            atmosphere="ethereal and serene",
+            camera=self.camera,
+            style="cinematic",
+        )
+        self.assertIs(other.subject, self.structure.subject)
+
 
 class TestVideoPromptAnalyzer(unittest.TestCase):
     """Test VideoPromptAnalyzer functionality"""
@@ -121,6 +151,40 @@ class TestVideoPromptAnalyzer(unittest.TestCase):
         self.assertIn("max_duration", info)
         self.assertIn("controllability_parameters", info)
 
+    def test_catalog_parsed_once(self):
+        """Test analyzers share one read-only parsed catalog"""
+        other = VideoPromptAnalyzer()
+        self.assertIs(other.catalog, self.analyzer.catalog)
+        with self.assertRaises(TypeError):
+            other.catalog["model_catalog"] = {}
+
+    def test_catalog_nested_entries_read_only(self):
+        """Test nested catalog entries cannot leak edits between analyzers"""
+        info = self.analyzer.get_model_info(ModelType.KLING)
+        with self.assertRaises(TypeError):
+            info["provider"] = "other"
+        with self.assertRaises(TypeError):
+            info["controllability_parameters"].clear()
+        practices = self.analyzer.get_best_practices_for_model(ModelType.KLING)
+        with self.assertRaises(TypeError):
+            next(iter(practices.values())).append("extra")
+
+        # Still plain JSON, and copies are ordinary mutable containers
+        self.assertEqual(json.loads(json.dumps(self.analyzer.catalog)), self.analyzer.catalog)
+        copied = copy.deepcopy(self.analyzer.catalog)
+        copied["model_catalog"]["kling"]["provider"] = "other"
+        self.assertNotEqual(info["provider"], "other")
+
+    def test_for_models(self):
+        """Test analyzer restricted to a subset of models"""
+        analyzer = VideoPromptAnalyzer.for_models({ModelType.KLING, ModelType.SORA2})
+        self.assertEqual(set(analyzer.model_catalog), {"kling", "sora2"})
+        self.assertEqual(
+            analyzer.get_temporal_critical_params(ModelType.KLING),
+            self.analyzer.get_temporal_critical_params(ModelType.KLING),
+        )
+        self.assertEqual(analyzer.get_model_info(ModelType.WAN), {})
+
     def test_get_temporal_critical_params(self):
         """Test identifying temporal critical parameters"""
         critical = self.analyzer.get_temporal_critical_params(ModelType.KLING)
@@ -149,6 +213,17 @@ class TestVideoPromptAnalyzer(unittest.TestCase):
         self.assertIn("temporal_consistency", optimized)
         self.assertLessEqual(optimized.get("motion_strength", 0), 0.7)
 
+    def test_optimize_copy_flag(self):
+        """Test optimization leaves input alone unless copy=False"""
+        params = {"motion_strength": 0.9}
+        optimized = self.analyzer.optimize_for_temporal_consistency(ModelType.RUNWAY, params)
+        self.assertEqual(params, {"motion_strength": 0.9})
+        self.assertEqual(optimized, {"motion_strength": 0.6, "seed": 42})
+
+        in_place = self.analyzer.optimize_for_temporal_consistency(ModelType.RUNWAY, params, copy=False)
+        self.assertIs(in_place, params)
+        self.assertEqual(params, optimized)
+
     def test_analyze_prompt_quality(self):
         """Test prompt quality analysis"""
         prompt = (
@@ -184,6 +259,8 @@ class TestVideoPromptAnalyzer(unittest.TestCase):
         self.assertIn("consistency_checks", plan)
         self.assertIn("character_consistency", plan["consistency_checks"])
         self.assertIn("scene_prompts", plan)
+        self.assertEqual([scene.temporal_config.seed for scene in scenes], [42, 43, 44])
+        self.assertIsNone(DEFAULT_TEMPORAL_CONFIG.seed)
 
     def test_map_to_cinematic_rules(self):
         """Test mapping to ANIMAtiZE rules"""